@@ -0,0 +1,63 @@
+"""Offline INT8 quantization of YOLO weights for CPU-only targets.
+
+Exports the model to ONNX and applies onnxruntime dynamic quantization
+(weights to int8, activations quantized at runtime - no calibration set
+needed). The detector picks up the resulting `<stem>.int8.onnx` file
+automatically when it starts on a machine without CUDA.
+
+Requires ultralytics and onnxruntime.
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def quantize(model_name: str, imgsz: int) -> Path:
+    """Export ONNX and write the dynamically quantized INT8 copy."""
+    from ultralytics import YOLO
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    logger.info(f"Exporting {model_name} to ONNX...")
+    onnx_path = Path(YOLO(model_name).export(format="onnx", imgsz=imgsz))
+
+    int8_path = Path(model_name).with_suffix(".int8.onnx")
+    logger.info("Quantizing weights to INT8...")
+    quantize_dynamic(str(onnx_path), str(int8_path), weight_type=QuantType.QInt8)
+
+    return int8_path
+
+
+def main():
+    """Main entry point for CPU-target YOLO quantization."""
+    parser = argparse.ArgumentParser(
+        description="Quantize YOLO weights to INT8 ONNX for CPU inference"
+    )
+    parser.add_argument(
+        "--model",
+        default="yolov8n.pt",
+        help="YOLO weights to quantize (default: yolov8n.pt)",
+    )
+    parser.add_argument(
+        "--imgsz",
+        type=int,
+        default=640,
+        help="Static input size for the export (default: 640)",
+    )
+
+    args = parser.parse_args()
+
+    int8_path = quantize(args.model, args.imgsz)
+    logger.info(f"✓ INT8 model written: {int8_path}")
+    logger.info("The detector will load it automatically on CUDA-less hosts.")
+
+
+if __name__ == "__main__":
+    main()
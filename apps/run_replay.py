@@ -5,6 +5,7 @@ import asyncio
 import logging
 import signal
 import sys
+import threading
 from pathlib import Path
 import uvicorn
 
@@ -19,6 +20,17 @@ from modules.navigation.module import NavigationModule
 from modules.fusion.module import FusionModule
 from ui.server import create_app
 
+# uvloop gives 2-3x asyncio throughput on the pub/sub + WebSocket workload;
+# fall back to the stock loop where it is unavailable (e.g. Windows).
+# install() covers the main pipeline loop; the UI server thread runs its
+# own loop, selected via the uvicorn config below.
+try:
+    import uvloop
+    uvloop.install()
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -70,6 +82,8 @@ class ReplaySystem:
         # Track tasks
         self.tasks = []
         self.shutdown_event = asyncio.Event()
+        self.ui_server = None
+        self.ui_thread = None
     
     async def start(self):
         """Start all components."""
@@ -88,16 +102,25 @@ class ReplaySystem:
             )
             self.tasks.extend(module_tasks)
         
-        # Start UI server in a separate task
+        # Start UI server on its own thread with its own event loop so a
+        # slow WebSocket client can never stall frame fan-out or the
+        # detection hot path; the buses hand events across loops thread-safely
         config = uvicorn.Config(
             self.app,
             host=self.host,
             port=self.port,
             log_level="info",
+            loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+            # Frames are already-compressed JPEG and events are small;
+            # permessage-deflate would burn CPU per connection for
+            # nothing (and recompress identical fan-out payloads per tab)
+            ws_per_message_deflate=False,
+        )
+        self.ui_server = uvicorn.Server(config)
+        self.ui_thread = threading.Thread(
+            target=self.ui_server.run, name="ui-server", daemon=True
         )
-        server = uvicorn.Server(config)
-        server_task = asyncio.create_task(server.serve())
-        self.tasks.append(server_task)
+        self.ui_thread.start()
         
         logger.info(f"✓ System started - UI available at http://{self.host}:{self.port}")
         
@@ -122,13 +145,24 @@ class ReplaySystem:
         await self.frame_bus.shutdown()
         await self.result_bus.shutdown()
         
-        # Cancel all tasks
+        # Stop UI server thread (bounded - don't wait out uvicorn's full
+        # graceful drain)
+        if self.ui_server is not None:
+            self.ui_server.should_exit = True
+        if self.ui_thread is not None:
+            self.ui_thread.join(timeout=2.0)
+            if self.ui_thread.is_alive():
+                logger.warning("UI server thread did not exit within 2s")
+        
+        # Cancel all tasks and give them a bounded window to unwind
         for task in self.tasks:
             if not task.done():
                 task.cancel()
         
-        # Wait for tasks to complete
-        await asyncio.gather(*self.tasks, return_exceptions=True)
+        if self.tasks:
+            done, pending = await asyncio.wait(self.tasks, timeout=1.0)
+            if pending:
+                logger.warning(f"{len(pending)} tasks still pending at shutdown")
         
         logger.info("✓ Shutdown complete")
     
@@ -200,8 +234,10 @@ def main():
         port=args.port,
     )
     
-    # Run system with asyncio.run
+    # Run system with asyncio.run (on uvloop when available)
     try:
+        if UVLOOP_AVAILABLE:
+            uvloop.install()
         asyncio.run(system.start())
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
@@ -5,6 +5,7 @@ from contracts.schemas import (
     Detection,
     DetectionResult,
     TrackUpdate,
+    TrackBatch,
     NavigationGuidance,
     FusionAnnouncement,
     ControlEvent,
@@ -16,6 +17,7 @@ __all__ = [
     "Detection",
     "DetectionResult",
     "TrackUpdate",
+    "TrackBatch",
     "NavigationGuidance",
     "FusionAnnouncement",
     "ControlEvent",
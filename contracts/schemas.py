@@ -1,118 +1,180 @@
-"""Message schemas for the smart glasses navigation pipeline."""
-
-from pydantic import BaseModel, Field
-from typing import Literal, Optional, Union
+"""Message schemas for the smart glasses navigation pipeline.
 
+Hot-path messages (frames, detections, tracks, guidance, metrics) are plain
+slotted dataclasses: they are produced internally at frame rate, so Pydantic's
+validation machinery is pure overhead for them. Pydantic is kept only for
+`ControlEvent`, which crosses the trust boundary from the UI.
+"""
 
-class FramePacket(BaseModel):
+from dataclasses import dataclass, field
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+# Resolved on first use by _encode_jpeg; deferring keeps this module free
+# of heavyweight imports for consumers that never touch pixels
+_jpeg_encode = None
+
+
+def _encode_jpeg(bgr: "np.ndarray") -> "bytes | memoryview":
+    """Encode BGR pixels to JPEG at quality 85.
+
+    Prefers libjpeg-turbo (SIMD, 4:2:0 subsampling, no intermediate
+    ndarray) and falls back to cv2.imencode when the binding is absent.
+    """
+    global _jpeg_encode
+    if _jpeg_encode is None:
+        try:
+            from turbojpeg import TurboJPEG, TJSAMP_420, TJFLAG_FASTDCT
+            tj = TurboJPEG()
+
+            def _jpeg_encode(img):
+                return tj.encode(
+                    img,
+                    quality=85,
+                    jpeg_subsample=TJSAMP_420,
+                    flags=TJFLAG_FASTDCT,
+                )
+        except Exception:
+            import cv2
+
+            def _jpeg_encode(img):
+                _, buffer = cv2.imencode(
+                    ".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 85]
+                )
+                return memoryview(buffer)
+    return _jpeg_encode(bgr)
+
+
+@dataclass(slots=True)
+class FramePacket:
     """Frame data published by video source."""
-    frame_id: int = Field(..., description="Sequential frame number")
-    timestamp_ms: int = Field(..., description="Timestamp in milliseconds")
-    width: int = Field(..., description="Frame width in pixels")
-    height: int = Field(..., description="Frame height in pixels")
-    jpg_bytes: bytes = Field(..., description="JPEG-encoded frame data")
-    
-    class Config:
-        arbitrary_types_allowed = True
-
-
-class Detection(BaseModel):
-    """Single object detection."""
-    label: str = Field(..., description="Object class label")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Detection confidence")
-    bbox: tuple[float, float, float, float] = Field(
-        ..., 
-        description="Normalized bounding box [x, y, w, h] in range 0..1"
-    )
-
-
-class DetectionResult(BaseModel):
+    frame_id: int  # Sequential frame number
+    timestamp_ms: int  # Timestamp in milliseconds
+    width: int  # Frame width in pixels
+    height: int  # Frame height in pixels
+    # JPEG-encoded frame data. Sources that already hold compressed bytes
+    # publish a memoryview over the encoder's output buffer so nothing is
+    # copied; sources that only have pixels leave this None and the
+    # jpg_bytes property encodes lazily on first access.
+    jpg: "bytes | memoryview | None" = None
+    # Set by the source when the frame is visually near-identical to the
+    # previous one; detection consumers skip it, UI streaming still sees it.
+    skip_detection: bool = False
+    # Decoded BGR pixels, attached by sources that already hold them (the
+    # camera and mp4 paths decode before encoding). Consumers that need
+    # pixels use this and skip the redundant cv2.imdecode; None when the
+    # source only had the JPEG. Never serialized to the UI.
+    bgr: "np.ndarray | None" = None
+
+    @property
+    def jpg_bytes(self) -> "bytes | memoryview":
+        """Compressed frame, encoding from bgr on first access.
+
+        Pixel-only sources (the camera) never pay the per-frame encode
+        unless a consumer actually wants JPEG; the result is cached on
+        the packet so the UI stream encodes at most once per frame.
+        """
+        if self.jpg is None:
+            self.jpg = _encode_jpeg(self.bgr)
+        return self.jpg
+
+
+@dataclass(slots=True, frozen=True)
+class Detection:
+    """Single object detection.
+
+    Frozen: detectors allocate many of these per frame and cached paths
+    share instances across results, so immutability is load-bearing.
+    """
+    label: str  # Object class label
+    confidence: float  # Detection confidence in range 0..1
+    bbox: tuple[float, float, float, float]  # Normalized [x, y, w, h] in range 0..1
+
+
+@dataclass(slots=True)
+class DetectionResult:
     """Detection results for a single frame."""
     frame_id: int
     timestamp_ms: int
-    objects: list[Detection] = Field(default_factory=list)
+    objects: list[Detection] = field(default_factory=list)
 
 
-class TrackUpdate(BaseModel):
+@dataclass(slots=True)
+class TrackUpdate:
     """Tracked object update."""
-    track_id: int = Field(..., description="Persistent track identifier")
+    track_id: int  # Persistent track identifier
     frame_id: int
     timestamp_ms: int
     label: str
     bbox: tuple[float, float, float, float]
-    stable: bool = Field(..., description="True if track has been seen for N+ consecutive frames")
-    velocity: Optional[tuple[float, float]] = Field(
-        None, 
-        description="Velocity [dx, dy] per frame in normalized coordinates"
-    )
+    stable: bool  # True if track has been seen for N+ consecutive frames
+    velocity: Optional[tuple[float, float]] = None  # [dx, dy] per frame, normalized
     # Navigation fields (set by NavigationModule)
-    direction: Optional[str] = Field(None, description="Horizontal position: left, center, right")
-    zone: Optional[str] = Field(None, description="Distance zone: near, mid, far")
-    movement: Optional[str] = Field(None, description="Movement: approaching, receding, stationary")
-    urgency: Optional[str] = Field(None, description="Urgency: low, medium, high, critical")
+    direction: Optional[str] = None  # Horizontal position: left, center, right
+    zone: Optional[str] = None  # Distance zone: near, mid, far
+    movement: Optional[str] = None  # Movement: approaching, receding, stationary
+    urgency: Optional[str] = None  # Urgency: low, medium, high, critical
+
+
+@dataclass(slots=True)
+class TrackBatch:
+    """Columnar (SoA) view of all track updates for one frame.
+
+    Published by the tracker alongside the per-track TrackUpdate events.
+    Batch consumers (navigation) read the arrays directly - the bboxes
+    land in NumPy exactly once, with no per-event repacking downstream.
+    """
+    frame_id: int
+    timestamp_ms: int
+    track_ids: "np.ndarray"  # int32 (N,)
+    labels: list[str]
+    bboxes: "np.ndarray"  # float32 (N, 4) normalized [x, y, w, h] rows
+    stable: "np.ndarray"  # bool (N,)
 
 
-class NavigationGuidance(BaseModel):
+@dataclass(slots=True)
+class NavigationGuidance:
     """Spatial reasoning and navigation guidance."""
     timestamp_ms: int
     track_id: int
     label: str
-    direction: Literal["left", "center", "right"] = Field(
-        ..., 
-        description="Horizontal position relative to camera"
-    )
-    zone: Literal["near", "mid", "far"] = Field(
-        ..., 
-        description="Distance zone based on bbox size"
-    )
-    movement: Literal["approaching", "receding", "stationary"] = Field(
-        ..., 
-        description="Movement pattern"
-    )
-    urgency: Literal["low", "medium", "high", "critical"] = Field(
-        ..., 
-        description="Urgency level for user notification"
-    )
-    guidance_text: str = Field(..., description="Human-readable guidance message")
+    direction: Literal["left", "center", "right"]  # Horizontal position relative to camera
+    zone: Literal["near", "mid", "far"]  # Distance zone based on bbox size
+    movement: Literal["approaching", "receding", "stationary"]  # Movement pattern
+    urgency: Literal["low", "medium", "high", "critical"]  # Urgency for user notification
+    guidance_text: str  # Human-readable guidance message
 
 
-class FusionAnnouncement(BaseModel):
+@dataclass(slots=True)
+class FusionAnnouncement:
     """Final announcement after fusion logic."""
     timestamp_ms: int
-    text: str = Field(..., description="Announcement text for TTS")
-    kind: Literal["object", "hazard", "navigation", "status"] = Field(
-        ..., 
-        description="Announcement category"
-    )
-    priority: int = Field(..., ge=1, le=5, description="Priority level (1=highest)")
+    text: str  # Announcement text for TTS
+    kind: Literal["object", "hazard", "navigation", "status"]  # Announcement category
+    priority: int  # Priority level (1=highest, 5=lowest)
 
 
 class ControlEvent(BaseModel):
     """Control command from UI or external source."""
     kind: Literal["play", "pause", "speed", "seek", "set_threshold", "describe_scene", "shutdown"] = Field(
-        ..., 
+        ...,
         description="Control action type"
     )
     value: Optional[dict] = Field(None, description="Optional parameters for the control action")
 
 
-class SystemMetric(BaseModel):
+@dataclass(slots=True)
+class SystemMetric:
     """System telemetry metric."""
     timestamp_ms: int
-    name: str = Field(..., description="Metric name")
-    value: float = Field(..., description="Metric value")
+    name: str  # Metric name
+    value: float  # Metric value
 
 
-class SceneDescription(BaseModel):
+@dataclass(slots=True)
+class SceneDescription:
     """Scene description - Natural language summary of current scene."""
     timestamp_ms: int
-    description: str = Field(
-        ..., 
-        description="Natural language scene description"
-    )
-    object_count: int = Field(..., description="Number of tracked objects")
-    track_ids: list[int] = Field(
-        default_factory=list,
-        description="Active track IDs in this description"
-    )
-
+    description: str  # Natural language scene description
+    object_count: int  # Number of tracked objects
+    track_ids: list[int] = field(default_factory=list)  # Active track IDs
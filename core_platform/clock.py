@@ -5,24 +5,37 @@ import time
 
 class Clock:
     """Helper for managing timestamps with speed control."""
-    
+
     def __init__(self, fps: int = 30):
         self.fps = fps
         self.frame_duration_ms = 1000 / fps
-        self.start_time_ms = int(time.time() * 1000)
-    
+        # Epoch base for UI-facing timestamps; per-frame math never reads the
+        # wall clock again, so NTP adjustments cannot skew the timeline.
+        self.start_time_ms = time.time_ns() // 1_000_000
+        self._default_frame_delay = 1.0 / fps
+
     def frame_to_timestamp(self, frame_id: int) -> int:
-        """Convert frame ID to timestamp in milliseconds."""
-        return self.start_time_ms + int(frame_id * self.frame_duration_ms)
-    
+        """Convert frame ID to timestamp in milliseconds.
+
+        Pure integer arithmetic - avoids the float multiply/truncate and the
+        precision drift it accumulates at large frame IDs.
+        """
+        return self.start_time_ms + frame_id * 1000 // self.fps
+
     def get_frame_delay(self, speed: float) -> float:
         """Get delay in seconds between frames at given speed."""
+        if speed == 1.0:
+            return self._default_frame_delay
         if speed <= 0:
             speed = 1.0
-        return (1.0 / self.fps) / speed
-    
+        return self._default_frame_delay / speed
+
     @staticmethod
     def now_ms() -> int:
-        """Get current timestamp in milliseconds."""
-        return int(time.time() * 1000)
+        """Get current timestamp in milliseconds (monotonic).
 
+        Monotonic so interval math (cooldowns, staleness checks) can never go
+        backwards when the wall clock is adjusted; also avoids the float
+        multiply of int(time.time() * 1000).
+        """
+        return time.monotonic_ns() // 1_000_000
@@ -1,42 +1,113 @@
 """Shared mutable state for system control."""
 
-from dataclasses import dataclass, field
+import asyncio
+from dataclasses import dataclass, replace, fields
 from threading import Lock
 from typing import Optional
 
 
-@dataclass
-class ControlState:
-    """Shared control state accessible by all modules."""
-    
+@dataclass(frozen=True, slots=True)
+class ControlSnapshot:
+    """Immutable view of the control state at one point in time."""
+
     # Playback control
     paused: bool = False
     speed: float = 1.0  # 0.5, 1.0, 2.0
     pending_seek: Optional[int] = None  # frame_id to seek to
-    
+
     # Module thresholds
     detection_conf_threshold: float = 0.5
     tracker_iou_threshold: float = 0.3
     fusion_cooldown_seconds: float = 3.0
-    
-    # Internal lock for thread-safe updates
-    _lock: Lock = field(default_factory=Lock, repr=False)
-    
+
+
+_SNAPSHOT_FIELDS = frozenset(f.name for f in fields(ControlSnapshot))
+
+
+class ControlState:
+    """Shared control state accessible by all modules.
+
+    Writers swap in a fresh immutable ControlSnapshot under a lock; readers
+    do a single atomic attribute load with no lock at all, so hot-loop
+    threshold reads cost a pointer dereference.
+    """
+
+    def __init__(self):
+        self._snap = ControlSnapshot()
+        self._lock = Lock()
+        # Set while running, cleared while paused. Bound lazily to the
+        # first loop that waits on it; cross-thread updates flip it via
+        # call_soon_threadsafe.
+        self._resume_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
     def update(self, **kwargs) -> None:
         """Thread-safe update of control state."""
+        known = {k: v for k, v in kwargs.items() if k in _SNAPSHOT_FIELDS}
+        if not known:
+            return
         with self._lock:
-            for key, value in kwargs.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
-    
+            self._snap = replace(self._snap, **known)
+            snap = self._snap
+        if "paused" in known and self._resume_event is not None:
+            target = (
+                self._resume_event.clear if snap.paused else self._resume_event.set
+            )
+            self._loop.call_soon_threadsafe(target)
+
+    async def wait_resumed(self) -> None:
+        """Block until playback is unpaused; returns immediately if running.
+
+        Sources await this instead of polling `paused` on a sleep grain,
+        so resume wakes them on the next loop tick.
+        """
+        if not self._snap.paused:
+            return
+        if self._resume_event is None:
+            self._loop = asyncio.get_running_loop()
+            self._resume_event = asyncio.Event()
+        # Sync the event to the current snapshot - an update racing the
+        # lazy creation above may have missed it
+        if self._snap.paused:
+            self._resume_event.clear()
+        else:
+            self._resume_event.set()
+        await self._resume_event.wait()
+
     def get_snapshot(self) -> dict:
         """Get a snapshot of current state."""
-        with self._lock:
-            return {
-                "paused": self.paused,
-                "speed": self.speed,
-                "detection_conf_threshold": self.detection_conf_threshold,
-                "tracker_iou_threshold": self.tracker_iou_threshold,
-                "fusion_cooldown_seconds": self.fusion_cooldown_seconds,
-            }
+        snap = self._snap
+        return {
+            "paused": snap.paused,
+            "speed": snap.speed,
+            "detection_conf_threshold": snap.detection_conf_threshold,
+            "tracker_iou_threshold": snap.tracker_iou_threshold,
+            "fusion_cooldown_seconds": snap.fusion_cooldown_seconds,
+        }
+
+    # Lock-free read accessors - each is a plain attribute load on the
+    # current snapshot, safe to call from any hot loop.
+
+    @property
+    def paused(self) -> bool:
+        return self._snap.paused
+
+    @property
+    def speed(self) -> float:
+        return self._snap.speed
+
+    @property
+    def pending_seek(self) -> Optional[int]:
+        return self._snap.pending_seek
+
+    @property
+    def detection_conf_threshold(self) -> float:
+        return self._snap.detection_conf_threshold
+
+    @property
+    def tracker_iou_threshold(self) -> float:
+        return self._snap.tracker_iou_threshold
 
+    @property
+    def fusion_cooldown_seconds(self) -> float:
+        return self._snap.fusion_cooldown_seconds
@@ -2,81 +2,167 @@
 
 import asyncio
 import logging
-from typing import AsyncIterator, Optional
+import threading
+from collections import deque
+from typing import AsyncIterator
 from contracts.schemas import FramePacket
 
 logger = logging.getLogger(__name__)
 
 
+class _SubscriberSlot:
+    """Latest-value buffer for one subscriber.
+
+    A bounded deque plus a wakeup event is strictly cheaper than an
+    asyncio.Queue for drop-oldest semantics: publish is an append + event
+    set with no queue bookkeeping or per-item waiter management.
+
+    The slot remembers the event loop it was created on so publishers
+    running on a different loop (e.g. the UI server thread) can hand off
+    via call_soon_threadsafe.
+
+    A stride > 1 makes the publisher deliver only every Nth frame to
+    this slot; the counter lives here but is advanced on the publisher's
+    side, so skipped frames never cost a delivery (or, for cross-loop
+    slots, a call_soon_threadsafe) at all.
+    """
+
+    __slots__ = ("frames", "event", "loop", "stride", "seq")
+
+    def __init__(self, depth: int, stride: int = 1):
+        self.frames: deque = deque(maxlen=depth)
+        self.event = asyncio.Event()
+        self.loop = asyncio.get_running_loop()
+        self.stride = stride
+        self.seq = 0
+
+
 class FrameBus:
     """
     Pub-sub bus for video frames with latest-frame-wins behavior.
-    
+
     Subscribers get the latest frame, old frames are dropped if not consumed.
     This prevents backpressure from slow consumers.
+
+    The subscriber list is a copy-on-write tuple: publishers read it without
+    taking any lock (attribute rebinding is atomic in CPython), while the rare
+    subscribe/unsubscribe operations rebuild the tuple under a short lock.
+    Subscribers on a different event loop than the publisher (the UI server
+    runs its own loop in a separate thread) are woken thread-safely.
     """
-    
+
     def __init__(self, queue_size: int = 2):
         self.queue_size = queue_size
-        self.subscribers: Optional[list[asyncio.Queue[FramePacket]]] = []
-        self._lock = asyncio.Lock()
+        self.subscribers: tuple[_SubscriberSlot, ...] = ()
+        self._subscribe_lock = threading.Lock()
         self._frame_count = 0
         self._dropped_count = 0
-    
+
+    def _push(self, slot: _SubscriberSlot, frame) -> None:
+        """Deliver one frame to a slot (runs on the slot's own loop)."""
+        # deque(maxlen=N) silently drops the oldest entry when full
+        if len(slot.frames) >= self.queue_size:
+            self._dropped_count += 1
+        slot.frames.append(frame)
+        slot.event.set()
+
     async def publish(self, frame: FramePacket) -> None:
         """Publish a frame to all subscribers."""
-        async with self._lock:
-            self._frame_count += 1
-            
-            for queue in self.subscribers:
-                # Drop oldest frame if queue is full
-                if queue.qsize() >= self.queue_size:
-                    try:
-                        queue.get_nowait()
-                        self._dropped_count += 1
-                    except asyncio.QueueEmpty:
-                        pass
-                
-                try:
-                    queue.put_nowait(frame)
-                except asyncio.QueueFull:
-                    # Should not happen after we just made space
-                    logger.warning(f"Frame queue full for subscriber, dropping frame {frame.frame_id}")
-                    self._dropped_count += 1
-    
-    async def subscribe(self) -> AsyncIterator[FramePacket]:
+        self._frame_count += 1
+        running_loop = asyncio.get_running_loop()
+
+        for slot in self.subscribers:
+            if slot.stride > 1:
+                slot.seq += 1
+                if slot.seq % slot.stride:
+                    continue
+            if slot.loop is running_loop:
+                self._push(slot, frame)
+            else:
+                slot.loop.call_soon_threadsafe(self._push, slot, frame)
+
+    def _push_many(self, slot: _SubscriberSlot, frames: list) -> None:
+        """Deliver a batch to a slot with one wakeup (runs on its loop)."""
+        for frame in frames:
+            if len(slot.frames) >= self.queue_size:
+                self._dropped_count += 1
+            slot.frames.append(frame)
+        slot.event.set()
+
+    async def publish_many(self, frames: "list[FramePacket]") -> None:
+        """Publish a batch of frames with one pass over the subscribers.
+
+        One event set (and, for cross-loop subscribers, one
+        call_soon_threadsafe) covers the whole batch instead of one per
+        frame. Latest-wins semantics are unchanged: a batch larger than
+        the queue depth keeps only its newest frames. Real-time sources
+        should keep publishing singly - batching trades latency for
+        scheduling overhead, which only suits faster-than-real-time
+        producers.
+        """
+        if not frames:
+            return
+        self._frame_count += len(frames)
+        running_loop = asyncio.get_running_loop()
+
+        for slot in self.subscribers:
+            if slot.stride > 1:
+                kept = []
+                for frame in frames:
+                    slot.seq += 1
+                    if slot.seq % slot.stride == 0:
+                        kept.append(frame)
+                if not kept:
+                    continue
+            else:
+                kept = frames
+            if slot.loop is running_loop:
+                self._push_many(slot, kept)
+            else:
+                slot.loop.call_soon_threadsafe(self._push_many, slot, kept)
+
+    async def subscribe(self, stride: int = 1) -> AsyncIterator[FramePacket]:
         """
         Subscribe to frame updates.
-        
+
         Yields frames as they are published. Old frames may be dropped.
+        With stride > 1 only every Nth published frame is delivered -
+        the rest are filtered out on the publisher's side, so a
+        rate-limited consumer (the UI stream) costs nothing for the
+        frames it would discard anyway.
         """
-        queue: Optional[asyncio.Queue[FramePacket]] = asyncio.Queue(maxsize=self.queue_size)
-        
-        async with self._lock:
-            self.subscribers.append(queue)
-        
+        slot = _SubscriberSlot(self.queue_size, stride)
+
+        with self._subscribe_lock:
+            self.subscribers = self.subscribers + (slot,)
+
         try:
             while True:
-                frame = await queue.get()
-                if frame is None:  # Shutdown signal
-                    break
-                yield frame
+                await slot.event.wait()
+                while slot.frames:
+                    frame = slot.frames.popleft()
+                    if frame is None:  # Shutdown signal
+                        return
+                    yield frame
+                slot.event.clear()
         finally:
-            async with self._lock:
-                if queue in self.subscribers:
-                    self.subscribers.remove(queue)
-    
+            with self._subscribe_lock:
+                self.subscribers = tuple(
+                    s for s in self.subscribers if s is not slot
+                )
+
     async def shutdown(self) -> None:
         """Signal all subscribers to stop."""
-        async with self._lock:
-            for queue in self.subscribers:
-                try:
-                    queue.put_nowait(None)
-                except asyncio.QueueFull:
-                    pass
-            
-            logger.info(
-                f"FrameBus stats - Published: {self._frame_count}, "
-                f"Dropped: {self._dropped_count}"
-            )
+        running_loop = asyncio.get_running_loop()
+
+        for slot in self.subscribers:
+            if slot.loop is running_loop:
+                self._push(slot, None)
+            else:
+                slot.loop.call_soon_threadsafe(self._push, slot, None)
 
+        logger.info(
+            "FrameBus stats - Published: %d, Dropped: %d",
+            self._frame_count,
+            self._dropped_count,
+        )
@@ -2,73 +2,163 @@
 
 import asyncio
 import logging
-from typing import AsyncIterator, Type, TypeVar, Optional
-from pydantic import BaseModel
+import threading
+from typing import Any, AsyncIterator, Callable, Type, TypeVar, Optional
 
 logger = logging.getLogger(__name__)
 
-T = TypeVar('T', bound=BaseModel)
+T = TypeVar('T')
+
+
+class _Subscriber:
+    """One subscriber queue plus the event loop it lives on.
+
+    Publishers on a different loop (e.g. the UI server thread) deliver via
+    call_soon_threadsafe instead of touching the queue directly.
+    """
+
+    __slots__ = ("queue", "loop")
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=queue_size)
+        self.loop = asyncio.get_running_loop()
 
 
 class ResultBus:
     """
     Pub-sub bus for typed events (detection results, tracks, guidance, etc.).
-    
-    Supports type-filtered subscriptions.
+
+    Supports type-filtered subscriptions. Typed subscribers are kept in a
+    per-type fanout table keyed on the exact event class, so publish only
+    touches the queues that actually want the event - no isinstance scan of
+    every event in every subscriber.
+
+    Subscriber tuples are copy-on-write: publishers read them without taking
+    any lock (attribute rebinding is atomic in CPython), while the rare
+    subscribe/unsubscribe operations rebuild them under a short lock.
     """
-    
+
     def __init__(self, queue_size: int = 100):
         self.queue_size = queue_size
-        self.subscribers: Optional[list[asyncio.Queue[BaseModel]]] = []
-        self._lock = asyncio.Lock()
+        self._by_type: dict[type, tuple[_Subscriber, ...]] = {}
+        self._all: tuple[_Subscriber, ...] = ()
+        self._callbacks: dict[type, tuple[Callable[[Any], None], ...]] = {}
+        self._subscribe_lock = threading.Lock()
         self._event_count = 0
-    
-    async def publish(self, event: BaseModel) -> None:
+
+    def on(self, event_type: type, callback: Callable[[Any], None]) -> None:
+        """Register a synchronous callback for events of an exact type.
+
+        The callback runs inline in publish() on the publisher's loop -
+        cheaper than a dedicated consumer coroutine for trivial state
+        updates, since it skips the queue hop and task scheduling entirely.
+        Callbacks must be fast and must not block.
+        """
+        with self._subscribe_lock:
+            self._callbacks[event_type] = self._callbacks.get(event_type, ()) + (callback,)
+
+    def has_subscribers(self, event_type: type) -> bool:
+        """True if anything would receive an event of this exact type.
+
+        Lets producers skip building events nobody consumes (e.g. during
+        detection-only benchmarks).
+        """
+        return bool(
+            self._by_type.get(event_type)
+            or self._all
+            or self._callbacks.get(event_type)
+        )
+
+    def _put(self, subscriber: _Subscriber, event: Any) -> None:
+        """Deliver one event to a subscriber (runs on its own loop)."""
+        try:
+            subscriber.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Lazy %-formatting: no string is built unless the record is emitted
+            logger.warning(
+                "Result queue full for subscriber, dropping event %s",
+                type(event).__name__,
+            )
+
+    def _publish_one(self, event: Any, running_loop) -> None:
+        """Fan one event out to callbacks and subscriber queues."""
+        for callback in self._callbacks.get(type(event), ()):
+            callback(event)
+
+        for sub in self._by_type.get(type(event), ()):
+            if sub.loop is running_loop:
+                self._put(sub, event)
+            else:
+                sub.loop.call_soon_threadsafe(self._put, sub, event)
+
+        for sub in self._all:
+            if sub.loop is running_loop:
+                self._put(sub, event)
+            else:
+                sub.loop.call_soon_threadsafe(self._put, sub, event)
+
+    async def publish(self, event: Any) -> None:
         """Publish an event to all subscribers."""
-        async with self._lock:
-            self._event_count += 1
-            
-            for queue in self.subscribers:
-                try:
-                    queue.put_nowait(event)
-                except asyncio.QueueFull:
-                    logger.warning(
-                        f"Result queue full for subscriber, dropping event "
-                        f"{type(event).__name__}"
-                    )
-    
-    async def subscribe_all(self) -> AsyncIterator[BaseModel]:
+        self._event_count += 1
+        self._publish_one(event, asyncio.get_running_loop())
+
+    async def publish_many(self, events: list) -> None:
+        """Publish a batch of events with a single coroutine round-trip.
+
+        Fanout itself never awaits, so the per-publish cost is the await
+        machinery; batching amortizes it over the whole list. Producers
+        that emit several events per frame should prefer this.
+        """
+        self._event_count += len(events)
+        running_loop = asyncio.get_running_loop()
+        for event in events:
+            self._publish_one(event, running_loop)
+
+    async def subscribe_all(self) -> AsyncIterator[Any]:
         """Subscribe to all events."""
-        queue: Optional[asyncio.Queue[BaseModel]] = asyncio.Queue(maxsize=self.queue_size)
-        
-        async with self._lock:
-            self.subscribers.append(queue)
-        
+        sub = _Subscriber(self.queue_size)
+
+        with self._subscribe_lock:
+            self._all = self._all + (sub,)
+
         try:
             while True:
-                event = await queue.get()
+                event = await sub.queue.get()
                 if event is None:  # Shutdown signal
                     break
                 yield event
         finally:
-            async with self._lock:
-                if queue in self.subscribers:
-                    self.subscribers.remove(queue)
-    
+            with self._subscribe_lock:
+                self._all = tuple(s for s in self._all if s is not sub)
+
     async def subscribe_type(self, event_type: Type[T]) -> AsyncIterator[T]:
-        """Subscribe to events of a specific type."""
-        async for event in self.subscribe_all():
-            if isinstance(event, event_type):
+        """Subscribe to events of a specific (exact) type."""
+        sub = _Subscriber(self.queue_size)
+
+        with self._subscribe_lock:
+            self._by_type[event_type] = self._by_type.get(event_type, ()) + (sub,)
+
+        try:
+            while True:
+                event = await sub.queue.get()
+                if event is None:  # Shutdown signal
+                    break
                 yield event
-    
+        finally:
+            with self._subscribe_lock:
+                self._by_type[event_type] = tuple(
+                    s for s in self._by_type[event_type] if s is not sub
+                )
+
     async def shutdown(self) -> None:
         """Signal all subscribers to stop."""
-        async with self._lock:
-            for queue in self.subscribers:
-                try:
-                    queue.put_nowait(None)
-                except asyncio.QueueFull:
-                    pass
-            
-            logger.info(f"ResultBus stats - Published: {self._event_count} events")
+        running_loop = asyncio.get_running_loop()
+
+        for subs in (*self._by_type.values(), self._all):
+            for sub in subs:
+                if sub.loop is running_loop:
+                    self._put(sub, None)
+                else:
+                    sub.loop.call_soon_threadsafe(self._put, sub, None)
 
+        logger.info(f"ResultBus stats - Published: {self._event_count} events")
@@ -4,11 +4,13 @@ import asyncio
 import logging
 from typing import Optional
 from modules.base import BaseModule
-from modules.fusion.policy import FusionPolicy
+from collections import OrderedDict
+from modules.fusion.policy import FusionPolicy, MAX_TRACKED_ANNOUNCEMENTS
 from contracts.schemas import NavigationGuidance, FusionAnnouncement, SystemMetric, TrackUpdate
 from core_platform.frame_bus import FrameBus
 from core_platform.result_bus import ResultBus
 from core_platform.control_state import ControlState
+from core_platform.clock import Clock
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +30,8 @@ class FusionModule(BaseModule):
         self.result_bus: Optional[ResultBus] = None
         self.control_state: Optional[ControlState] = None
         
-        # Track stability info
-        self.track_stability: dict[int, bool] = {}
+        # Track stability info (LRU-bounded, same cap as the policy tables)
+        self.track_stability: OrderedDict[int, bool] = OrderedDict()
     
     async def start(
         self,
@@ -42,51 +44,82 @@ class FusionModule(BaseModule):
         self.control_state = control_state
         self.running = True
         
-        # Start two tasks: one for navigation guidance, one for track updates
+        # Track stability is a trivial per-event state update; a sync
+        # callback avoids a queue hop and consumer coroutine per TrackUpdate
+        result_bus.on(TrackUpdate, self._on_track_update)
+        
         task1 = asyncio.create_task(self._process_guidance())
-        task2 = asyncio.create_task(self._monitor_track_stability())
+        task2 = asyncio.create_task(self._emit_metrics())
         
         logger.info(f"{self.name} module started")
         return [task1, task2]
     
-    async def _monitor_track_stability(self) -> None:
-        """Monitor track updates to maintain stability info."""
+    def _on_track_update(self, event: TrackUpdate) -> None:
+        """Record track stability (runs inline in ResultBus.publish)."""
+        if event.track_id not in self.track_stability and \
+                len(self.track_stability) >= MAX_TRACKED_ANNOUNCEMENTS:
+            self.track_stability.popitem(last=False)
+        self.track_stability[event.track_id] = event.stable
+        self.track_stability.move_to_end(event.track_id)
+    
+    async def _emit_metrics(self) -> None:
+        """Publish the announcement counter once per second.
+
+        Keeps telemetry off the per-guidance hot path and gives the metric a
+        deterministic cadence independent of event volume.
+        """
         try:
-            async for event in self.result_bus.subscribe_type(TrackUpdate):
-                if not self.running:
-                    break
-                
-                self.track_stability[event.track_id] = event.stable
+            while self.running:
+                await asyncio.sleep(1.0)
+                metric = SystemMetric(
+                    timestamp_ms=Clock.now_ms(),
+                    name="fusion.announcements.count",
+                    value=float(self.policy.announcement_count),
+                )
+                await self.result_bus.publish(metric)
         
         except Exception as e:
-            logger.error(f"{self.name} stability monitor error: {e}", exc_info=True)
+            logger.error(f"{self.name} metrics error: {e}", exc_info=True)
     
     async def _process_guidance(self) -> None:
         """Process navigation guidance and generate announcements."""
+        # Bind hot-loop lookups to locals once; each would otherwise cost an
+        # attribute/dict lookup per guidance event.
+        policy = self.policy
+        stability = self.track_stability
+        control_state = self.control_state
+        publish = self.result_bus.publish
+
+        last_cooldown_seconds = control_state.fusion_cooldown_seconds
+        cooldown_ms = int(last_cooldown_seconds * 1000)
+
         try:
             async for guidance in self.result_bus.subscribe_type(NavigationGuidance):
                 if not self.running:
                     break
-                
+
                 # Get track stability
-                stable = self.track_stability.get(guidance.track_id, False)
-                
-                # Check if should announce
-                cooldown_ms = int(self.control_state.fusion_cooldown_seconds * 1000)
-                
-                should_announce = self.policy.should_announce(
+                stable = stability.get(guidance.track_id, False)
+
+                # Recompute cooldown only when the control value changed
+                cooldown_seconds = control_state.fusion_cooldown_seconds
+                if cooldown_seconds != last_cooldown_seconds:
+                    last_cooldown_seconds = cooldown_seconds
+                    cooldown_ms = int(cooldown_seconds * 1000)
+
+                should_announce = policy.should_announce(
                     guidance.track_id,
                     guidance.timestamp_ms,
                     guidance.urgency,
                     stable,
                     cooldown_ms,
                 )
-                
+
                 if should_announce:
                     # Get priority and kind
-                    priority = self.policy.get_priority(guidance.urgency)
-                    kind = self.policy.get_announcement_kind(guidance.label)
-                    
+                    priority = policy.get_priority(guidance.urgency)
+                    kind = policy.get_announcement_kind(guidance.label)
+
                     # Create announcement
                     announcement = FusionAnnouncement(
                         timestamp_ms=guidance.timestamp_ms,
@@ -94,28 +127,21 @@ class FusionModule(BaseModule):
                         kind=kind,
                         priority=priority,
                     )
-                    
-                    await self.result_bus.publish(announcement)
-                    
+
+                    await publish(announcement)
+
                     # Record announcement
-                    self.policy.record_announcement(
+                    policy.record_announcement(
                         guidance.track_id,
                         guidance.timestamp_ms,
                     )
-                    
+
                     logger.debug(
-                        f"{self.name}: announced - {guidance.guidance_text} "
-                        f"(priority {priority})"
-                    )
-                
-                # Publish metric every 100 announcements
-                if self.policy.announcement_count % 100 == 0 and self.policy.announcement_count > 0:
-                    metric = SystemMetric(
-                        timestamp_ms=guidance.timestamp_ms,
-                        name="fusion.announcements.count",
-                        value=float(self.policy.announcement_count),
+                        "%s: announced - %s (priority %d)",
+                        self.name,
+                        guidance.guidance_text,
+                        priority,
                     )
-                    await self.result_bus.publish(metric)
         
         except Exception as e:
             logger.error(f"{self.name} error: {e}", exc_info=True)
@@ -1,16 +1,36 @@
 """Fusion policy logic."""
 
+from collections import OrderedDict
 from typing import Literal
 
+# Cap on remembered tracks; long replay sessions would otherwise grow the
+# cooldown table without bound for every track ID ever seen.
+MAX_TRACKED_ANNOUNCEMENTS = 1024
+
+# Lookup tables built once at import; these run for every announcement, so
+# per-call dict/list literals would just be reallocated and thrown away.
+PRIORITY_MAP = {
+    "critical": 1,
+    "high": 2,
+    "medium": 3,
+    "low": 4,
+}
+
+HAZARD_LABELS = frozenset({"hazard", "obstacle"})
+OBJECT_LABELS = frozenset({"person", "vehicle"})
+
 
 class FusionPolicy:
     """
     Manages announcement cooldown and prioritization.
+
+    Announcement state is kept in an LRU-bounded map so memory stays O(cap)
+    regardless of how long the session runs.
     """
     
     def __init__(self):
-        # Track last announcement time per track_id
-        self.last_announced: dict[int, int] = {}  # track_id -> timestamp_ms
+        # Track last announcement time per track_id (LRU order, oldest first)
+        self.last_announced: OrderedDict[int, int] = OrderedDict()
         self.announcement_count = 0
     
     def should_announce(
@@ -52,7 +72,11 @@ class FusionPolicy:
     
     def record_announcement(self, track_id: int, timestamp_ms: int) -> None:
         """Record that an announcement was made."""
+        if track_id not in self.last_announced and \
+                len(self.last_announced) >= MAX_TRACKED_ANNOUNCEMENTS:
+            self.last_announced.popitem(last=False)
         self.last_announced[track_id] = timestamp_ms
+        self.last_announced.move_to_end(track_id)
         self.announcement_count += 1
     
     def get_priority(self, urgency: Literal["low", "medium", "high", "critical"]) -> int:
@@ -62,13 +86,7 @@ class FusionPolicy:
         Returns:
             Priority (1=highest, 5=lowest)
         """
-        priority_map = {
-            "critical": 1,
-            "high": 2,
-            "medium": 3,
-            "low": 4,
-        }
-        return priority_map.get(urgency, 5)
+        return PRIORITY_MAP.get(urgency, 5)
     
     def get_announcement_kind(self, label: str) -> Literal["object", "hazard", "navigation", "status"]:
         """
@@ -80,9 +98,9 @@ class FusionPolicy:
         Returns:
             Announcement kind
         """
-        if label in ["hazard", "obstacle"]:
+        if label in HAZARD_LABELS:
             return "hazard"
-        elif label in ["person", "vehicle"]:
+        elif label in OBJECT_LABELS:
             return "object"
         else:
             return "navigation"
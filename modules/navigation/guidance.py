@@ -2,36 +2,34 @@
 
 from typing import Literal
 
+from modules.navigation.spatial import (
+    DIRECTIONS,
+    ZONES,
+    MOVEMENTS,
+    Direction,
+    Zone,
+    Movement,
+)
 
-def generate_guidance_text(
+
+def _render_guidance_text(
     label: str,
     direction: Literal["left", "center", "right"],
     zone: Literal["near", "mid", "far"],
     movement: Literal["approaching", "receding", "stationary"],
 ) -> str:
-    """
-    Generate natural language guidance text.
-    
-    Args:
-        label: Object label
-        direction: Horizontal direction
-        zone: Distance zone
-        movement: Movement pattern
-    
-    Returns:
-        Guidance text string
-    """
+    """Reference template logic - evaluated once per state at import time."""
     # Critical situations
     if zone == "near" and movement == "approaching":
         return f"{label} very close, {direction}"
-    
+
     # Approaching objects
     if movement == "approaching":
         if zone == "mid":
             return f"{label} approaching on {direction}"
         else:  # far
             return f"{label} detected {direction}"
-    
+
     # Stationary objects
     if movement == "stationary":
         if zone == "near":
@@ -40,11 +38,52 @@ def generate_guidance_text(
             return f"{label} ahead on {direction}"
         else:
             return f"{label} {direction}"
-    
+
     # Receding objects
     if movement == "receding":
         return f"{label} moving away"
-    
+
     # Fallback
     return f"{label} {direction}"
 
+
+# The template function is pure over 3x3x3 inputs, so the 27 possible
+# strings are precomputed with a "{}" label placeholder and picked by a
+# single flat index at runtime - no branching per call.
+_TEMPLATES = tuple(
+    _render_guidance_text("{}", d, z, m)
+    for d in DIRECTIONS
+    for z in ZONES
+    for m in MOVEMENTS
+)
+
+
+def guidance_text_from_codes(
+    label: str,
+    dir_code: int,
+    zone_code: int,
+    move_code: int,
+) -> str:
+    """Generate guidance text from integer codes (see spatial.analyze_batch)."""
+    return _TEMPLATES[dir_code * 9 + zone_code * 3 + move_code].format(label)
+
+
+def generate_guidance_text(
+    label: str,
+    direction: Direction,
+    zone: Zone,
+    movement: Movement,
+) -> str:
+    """
+    Generate natural language guidance text.
+
+    Args:
+        label: Object label
+        direction: Horizontal direction code
+        zone: Distance zone code
+        movement: Movement pattern code
+
+    Returns:
+        Guidance text string
+    """
+    return guidance_text_from_codes(label, direction, zone, movement)
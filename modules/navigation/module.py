@@ -2,40 +2,57 @@
 
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import Optional
+
+import numpy as np
+
 from modules.base import BaseModule
 from modules.navigation.spatial import (
-    analyze_direction,
-    analyze_zone,
-    analyze_movement,
-    compute_urgency,
+    DIRECTIONS,
+    ZONES,
+    MOVEMENTS,
+    URGENCIES,
+    analyze_batch,
+    warmup,
 )
-from modules.navigation.guidance import generate_guidance_text
-from contracts.schemas import TrackUpdate, NavigationGuidance
+from modules.navigation.guidance import guidance_text_from_codes
+from contracts.schemas import TrackBatch, NavigationGuidance
 from core_platform.frame_bus import FrameBus
 from core_platform.result_bus import ResultBus
 from core_platform.control_state import ControlState
 
 logger = logging.getLogger(__name__)
 
+# Cap on per-track movement history; bounds memory over long sessions where
+# track IDs keep growing and old ones are never revisited.
+MAX_TRACKED_HISTORY = 1024
+
 
 class NavigationModule(BaseModule):
     """
     Navigation and spatial reasoning module.
-    
-    Subscribes to TrackUpdate and publishes NavigationGuidance.
+
+    Subscribes to the tracker's columnar TrackBatch and publishes
+    NavigationGuidance.
+
+    Each batch arrives with bboxes already stacked as an (N, 4) array, so
+    a frame's direction/zone/movement/urgency analysis is a few NumPy
+    passes with no per-event repacking - and no waiting for the next
+    frame's first event to know the previous frame is complete.
     """
-    
+
     name = "Navigation"
-    
+
     def __init__(self):
         self.running = False
         self.result_bus: Optional[ResultBus] = None
         self.control_state: Optional[ControlState] = None
-        
-        # Store track history for movement analysis
-        self.track_history: dict[int, list[dict]] = {}
-    
+
+        # Previous bbox area per track_id, for movement analysis
+        # (LRU-bounded; stale tracks fall off the cold end)
+        self._prev_area: OrderedDict[int, float] = OrderedDict()
+
     async def start(
         self,
         frame_bus: FrameBus,
@@ -46,74 +63,108 @@ class NavigationModule(BaseModule):
         self.result_bus = result_bus
         self.control_state = control_state
         self.running = True
-        
+
+        # Compile the spatial kernel now rather than on the first frame
+        warmup()
+
         task = asyncio.create_task(self._process_tracks())
         logger.info(f"{self.name} module started")
         return [task]
-    
+
     async def _process_tracks(self) -> None:
-        """Process track updates and generate navigation guidance."""
+        """Generate navigation guidance from per-frame track batches."""
+        # Rechecked every 30 frames: when nothing consumes guidance (e.g.
+        # a detection-only benchmark), skip the analysis entirely and only
+        # keep the movement history warm
+        consumed = True
+        frames_until_check = 0
+
         try:
-            async for event in self.result_bus.subscribe_type(TrackUpdate):
+            async for batch in self.result_bus.subscribe_type(TrackBatch):
                 if not self.running:
                     break
-                
-                # Update track history
-                if event.track_id not in self.track_history:
-                    self.track_history[event.track_id] = []
-                
-                self.track_history[event.track_id].append({
-                    "bbox": event.bbox,
-                    "frame_id": event.frame_id,
-                    "timestamp_ms": event.timestamp_ms,
-                })
-                
-                # Keep only recent history (last 5 entries)
-                if len(self.track_history[event.track_id]) > 5:
-                    self.track_history[event.track_id] = self.track_history[event.track_id][-5:]
-                
-                # Analyze spatial properties
-                direction = analyze_direction(event.bbox)
-                zone = analyze_zone(event.bbox)
-                movement = analyze_movement(
-                    event.bbox,
-                    self.track_history[event.track_id]
-                )
-                urgency = compute_urgency(zone, movement)
-                
-                # Generate guidance text
-                guidance_text = generate_guidance_text(
-                    event.label,
-                    direction,
-                    zone,
-                    movement,
-                )
-                
-                # Create guidance event
-                guidance = NavigationGuidance(
-                    timestamp_ms=event.timestamp_ms,
-                    track_id=event.track_id,
-                    label=event.label,
-                    direction=direction,
-                    zone=zone,
-                    movement=movement,
-                    urgency=urgency,
-                    guidance_text=guidance_text,
-                )
-                
-                await self.result_bus.publish(guidance)
-                
-                if event.frame_id % 100 == 0:
-                    logger.debug(
-                        f"{self.name}: frame {event.frame_id}, "
-                        f"track {event.track_id} - {guidance_text}"
+
+                if frames_until_check == 0:
+                    consumed = self.result_bus.has_subscribers(
+                        NavigationGuidance
                     )
-        
+                    frames_until_check = 30
+                frames_until_check -= 1
+
+                if consumed:
+                    await self._process_batch(batch)
+                else:
+                    self._update_history(batch)
+
         except Exception as e:
             logger.error(f"{self.name} error: {e}", exc_info=True)
-    
+
+    def _update_history(self, batch: TrackBatch) -> None:
+        """Record per-track areas without running the full analysis."""
+        areas = batch.bboxes[:, 2] * batch.bboxes[:, 3]
+        for track_id, area in zip(batch.track_ids.tolist(), areas):
+            if track_id not in self._prev_area and \
+                    len(self._prev_area) >= MAX_TRACKED_HISTORY:
+                self._prev_area.popitem(last=False)
+            self._prev_area[track_id] = float(area)
+            self._prev_area.move_to_end(track_id)
+
+    async def _process_batch(self, batch: TrackBatch) -> None:
+        """Analyze all tracks of one frame in a single vectorized pass."""
+        track_ids = batch.track_ids.tolist()
+        prev_areas = np.array(
+            [self._prev_area.get(tid, np.nan) for tid in track_ids],
+            dtype=np.float32,
+        )
+
+        dir_codes, zone_codes, move_codes, urgency_codes, areas = analyze_batch(
+            batch.bboxes, prev_areas
+        )
+
+        guidance_events: list[NavigationGuidance] = []
+        for i, track_id in enumerate(track_ids):
+            if track_id not in self._prev_area and \
+                    len(self._prev_area) >= MAX_TRACKED_HISTORY:
+                self._prev_area.popitem(last=False)
+            self._prev_area[track_id] = float(areas[i])
+            self._prev_area.move_to_end(track_id)
+
+            label = batch.labels[i]
+
+            # Generate guidance text straight from the integer codes
+            guidance_text = guidance_text_from_codes(
+                label,
+                dir_codes[i],
+                zone_codes[i],
+                move_codes[i],
+            )
+
+            guidance_events.append(
+                NavigationGuidance(
+                    timestamp_ms=batch.timestamp_ms,
+                    track_id=track_id,
+                    label=label,
+                    direction=DIRECTIONS[dir_codes[i]],
+                    zone=ZONES[zone_codes[i]],
+                    movement=MOVEMENTS[move_codes[i]],
+                    urgency=URGENCIES[urgency_codes[i]],
+                    guidance_text=guidance_text,
+                )
+            )
+
+            if batch.frame_id % 100 == 0:
+                logger.debug(
+                    "%s: frame %d, track %d - %s",
+                    self.name,
+                    batch.frame_id,
+                    track_id,
+                    guidance_text,
+                )
+
+        # One await for the whole frame instead of one per track
+        await self.result_bus.publish_many(guidance_events)
+
     async def stop(self) -> None:
         """Stop the module."""
         self.running = False
         logger.info(f"{self.name} module stopped")
-
@@ -1,9 +1,168 @@
 """Spatial analysis utilities."""
 
-from typing import Literal
+import logging
+from enum import IntEnum
+from typing import Optional
 
+import numpy as np
 
-def analyze_direction(bbox: tuple[float, float, float, float]) -> Literal["left", "center", "right"]:
+logger = logging.getLogger(__name__)
+
+# Numba fuses the batch analyzer into a single compiled loop with no
+# intermediate arrays; without it the NumPy multi-pass path is used.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+class Direction(IntEnum):
+    LEFT = 0
+    CENTER = 1
+    RIGHT = 2
+
+
+class Zone(IntEnum):
+    NEAR = 0
+    MID = 1
+    FAR = 2
+
+
+class Movement(IntEnum):
+    APPROACHING = 0
+    RECEDING = 1
+    STATIONARY = 2
+
+
+class Urgency(IntEnum):
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
+
+
+# Code -> label tables shared by the batch analyzer and its callers;
+# strings exist only for the serialization boundary (events, UI).
+DIRECTIONS = ("left", "center", "right")
+ZONES = ("near", "mid", "far")
+MOVEMENTS = ("approaching", "receding", "stationary")
+URGENCIES = ("low", "medium", "high", "critical")
+
+_DIRECTION_BINS = np.array([0.33, 0.66])
+_ZONE_BINS = np.array([0.05, 0.15])
+
+# Urgency code indexed by zone_code * 3 + move_code; mirrors compute_urgency
+_URGENCY_LUT = np.array(
+    [
+        3, 2, 2,  # near: approaching -> critical, else -> high
+        1, 0, 0,  # mid: approaching -> medium, else -> low
+        0, 0, 0,  # far: always low
+    ],
+    dtype=np.int8,
+)
+
+
+def analyze_batch(
+    bboxes: np.ndarray,
+    prev_areas: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized spatial analysis for all tracks of one frame.
+
+    Equivalent to calling analyze_direction/analyze_zone/analyze_movement/
+    compute_urgency per track, but in a handful of C-level array passes
+    instead of N interpreter trips.
+
+    Args:
+        bboxes: (N, 4) array of (x, y, w, h) in normalized coordinates
+        prev_areas: (N,) array of each track's previous bbox area
+                    (NaN where the track has no history)
+
+    Returns:
+        (dir_codes, zone_codes, move_codes, urgency_codes, areas) - integer
+        code arrays indexing DIRECTIONS/ZONES/MOVEMENTS/URGENCIES, plus the
+        computed areas for updating per-track history.
+    """
+    centers_x = bboxes[:, 0] + 0.5 * bboxes[:, 2]
+    areas = bboxes[:, 2] * bboxes[:, 3]
+
+    dir_codes = np.digitize(centers_x, _DIRECTION_BINS)
+    zone_codes = 2 - np.digitize(areas, _ZONE_BINS, right=True)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = areas / prev_areas
+    # NaN ratios (no history) fail both comparisons -> stationary
+    move_codes = np.where(ratio > 1.05, 0, np.where(ratio < 0.95, 1, 2))
+
+    urgency_codes = _URGENCY_LUT[zone_codes * 3 + move_codes]
+
+    return dir_codes, zone_codes, move_codes, urgency_codes, areas
+
+
+def _analyze_batch_kernel(bboxes, prev_areas, out_dir, out_zone, out_move, out_urg, out_area):
+    """Single fused loop over the batch - compiled by Numba when available.
+
+    Same semantics as the NumPy path: one pass, no temporaries, NaN
+    previous areas (no history) fall through to stationary.
+    """
+    for i in range(bboxes.shape[0]):
+        cx = bboxes[i, 0] + 0.5 * bboxes[i, 2]
+        area = bboxes[i, 2] * bboxes[i, 3]
+        out_area[i] = area
+
+        out_dir[i] = 0 if cx < 0.33 else (1 if cx < 0.66 else 2)
+
+        zone = 0 if area > 0.15 else (1 if area > 0.05 else 2)
+        out_zone[i] = zone
+
+        prev = prev_areas[i]
+        # NaN comparisons are False, so missing history lands on stationary
+        if area > prev * 1.05:
+            move = 0
+        elif area < prev * 0.95:
+            move = 1
+        else:
+            move = 2
+        out_move[i] = move
+
+        out_urg[i] = _URGENCY_LUT[zone * 3 + move]
+
+
+if NUMBA_AVAILABLE:
+    _analyze_batch_kernel = njit(cache=True)(_analyze_batch_kernel)
+
+    _numpy_analyze_batch = analyze_batch
+
+    def analyze_batch(bboxes, prev_areas):
+        n = bboxes.shape[0]
+        out_dir = np.empty(n, dtype=np.int8)
+        out_zone = np.empty(n, dtype=np.int8)
+        out_move = np.empty(n, dtype=np.int8)
+        out_urg = np.empty(n, dtype=np.int8)
+        out_area = np.empty(n, dtype=np.float32)
+        _analyze_batch_kernel(
+            bboxes, prev_areas, out_dir, out_zone, out_move, out_urg, out_area
+        )
+        return out_dir, out_zone, out_move, out_urg, out_area
+
+    analyze_batch.__doc__ = _numpy_analyze_batch.__doc__
+
+
+def warmup() -> None:
+    """Compile the JIT kernel off the hot path (no-op without Numba).
+
+    Called at module start so the first real frame doesn't pay the
+    compilation stall.
+    """
+    if NUMBA_AVAILABLE:
+        analyze_batch(
+            np.zeros((1, 4), dtype=np.float32),
+            np.full(1, np.nan, dtype=np.float32),
+        )
+        logger.debug("Numba spatial kernel compiled")
+
+
+def analyze_direction(bbox: tuple[float, float, float, float]) -> Direction:
     """
     Determine horizontal direction based on bbox center.
     
@@ -11,20 +170,20 @@ def analyze_direction(bbox: tuple[float, float, float, float]) -> Literal["left"
         bbox: (x, y, w, h) in normalized coordinates
     
     Returns:
-        "left", "center", or "right"
+        Direction code (integer compare downstream, not string compare)
     """
     x, y, w, h = bbox
     center_x = x + w / 2
     
     if center_x < 0.33:
-        return "left"
+        return Direction.LEFT
     elif center_x < 0.66:
-        return "center"
+        return Direction.CENTER
     else:
-        return "right"
+        return Direction.RIGHT
 
 
-def analyze_zone(bbox: tuple[float, float, float, float]) -> Literal["near", "mid", "far"]:
+def analyze_zone(bbox: tuple[float, float, float, float]) -> Zone:
     """
     Determine distance zone based on bbox area (proxy for distance).
     
@@ -32,66 +191,62 @@ def analyze_zone(bbox: tuple[float, float, float, float]) -> Literal["near", "mi
         bbox: (x, y, w, h) in normalized coordinates
     
     Returns:
-        "near", "mid", or "far"
+        Zone code
     """
     x, y, w, h = bbox
     area = w * h
     
     if area > 0.15:
-        return "near"
+        return Zone.NEAR
     elif area > 0.05:
-        return "mid"
+        return Zone.MID
     else:
-        return "far"
+        return Zone.FAR
 
 
 def analyze_movement(
-    current_bbox: tuple[float, float, float, float],
-    history: list[dict],
-) -> Literal["approaching", "receding", "stationary"]:
+    current_area: float,
+    prev_area: Optional[float],
+) -> Movement:
     """
     Determine movement pattern based on bbox size change.
     
+    Callers pass precomputed areas (they already have them for zone
+    analysis); a track with no history passes None.
+    
     Args:
-        current_bbox: Current bbox
-        history: List of historical track data
+        current_area: Current bbox area (normalized)
+        prev_area: Previous bbox area, or None if the track has no history
     
     Returns:
-        "approaching", "receding", or "stationary"
+        Movement code
     """
-    if len(history) < 2:
-        return "stationary"
-    
-    prev_bbox = history[-2]["bbox"]
-    
-    current_area = current_bbox[2] * current_bbox[3]
-    prev_area = prev_bbox[2] * prev_bbox[3]
+    if prev_area is None:
+        return Movement.STATIONARY
     
     # Growing = approaching, shrinking = receding
     if current_area > prev_area * 1.05:
-        return "approaching"
+        return Movement.APPROACHING
     elif current_area < prev_area * 0.95:
-        return "receding"
+        return Movement.RECEDING
     else:
-        return "stationary"
+        return Movement.STATIONARY
 
 
-def compute_urgency(
-    zone: Literal["near", "mid", "far"],
-    movement: Literal["approaching", "receding", "stationary"],
-) -> Literal["low", "medium", "high", "critical"]:
+# Urgency by (zone, movement); the enum twin of _URGENCY_LUT above
+_URGENCY_TABLE = (
+    (Urgency.CRITICAL, Urgency.HIGH, Urgency.HIGH),
+    (Urgency.MEDIUM, Urgency.LOW, Urgency.LOW),
+    (Urgency.LOW, Urgency.LOW, Urgency.LOW),
+)
+
+
+def compute_urgency(zone: Zone, movement: Movement) -> Urgency:
     """
     Compute urgency level based on zone and movement.
     
     Returns:
-        "low", "medium", "high", or "critical"
+        Urgency code (two integer indexes, no string comparisons)
     """
-    if zone == "near" and movement == "approaching":
-        return "critical"
-    elif zone == "near":
-        return "high"
-    elif zone == "mid" and movement == "approaching":
-        return "medium"
-    else:
-        return "low"
+    return _URGENCY_TABLE[zone][movement]
 
@@ -1,7 +1,9 @@
 """YOLO detector - Real ML-based object detection using Ultralytics YOLO."""
 
 import logging
+from pathlib import Path
 from typing import List
+import cv2
 import numpy as np
 from contracts.schemas import Detection
 
@@ -27,13 +29,20 @@ class YOLODetector:
     - x = extra large (slowest, most accurate)
     """
     
-    def __init__(self, model_name: str = "yolov8n.pt", conf_threshold: float = 0.5):
+    def __init__(
+        self,
+        model_name: str = "yolov8n.pt",
+        conf_threshold: float = 0.5,
+        accelerate: bool = True,
+    ):
         """
         Initialize YOLO detector.
         
         Args:
             model_name: YOLO model to use (e.g., "yolov8n.pt", "yolov8s.pt")
             conf_threshold: Minimum confidence threshold (will be overridden by ControlState)
+            accelerate: Prefer a cached FP16 TensorRT engine on CUDA targets,
+                exporting one next to the .pt on first run
         """
         if not YOLO_AVAILABLE:
             raise ImportError(
@@ -44,11 +53,81 @@ class YOLODetector:
         self.model_name = model_name
         self.conf_threshold = conf_threshold
         
+        if accelerate:
+            model_name = self._resolve_accelerated(model_name)
+        
         logger.info(f"Loading YOLO model: {model_name}")
         self.model = YOLO(model_name)
+        self._warmup()
         logger.info(f"✓ YOLO model loaded successfully")
     
-    def detect(self, frame_id: int, width: int, height: int, frame_data: bytes = None) -> List[Detection]:
+    def _warmup(self) -> None:
+        """Run one dummy inference so steady state is reached before frame 1.
+        
+        The first call allocates the input tensor, NMS buffers and (on GPU)
+        the CUDA caching-allocator arenas; doing it here keeps that
+        one-time churn out of the live frame stream. Reusing a pinned
+        staging buffer across calls would go further but needs Ultralytics'
+        private predictor API, which changes between releases.
+        """
+        try:
+            dummy = np.zeros((640, 640, 3), dtype=np.uint8)
+            self.model(dummy, verbose=False)
+        except Exception as e:
+            logger.warning(f"YOLO warmup inference failed: {e}")
+    
+    @staticmethod
+    def _resolve_accelerated(model_name: str) -> str:
+        """Pick the fastest available form of the model for this machine.
+        
+        On CUDA targets an FP16 TensorRT engine is 2-4x faster than the
+        FP32 .pt and uses half the memory bandwidth. The engine is exported
+        once and cached next to the weights; any failure (no TensorRT, no
+        GPU, export error) falls back to the original file. INT8 would be
+        faster still but needs a calibration set, so we stop at FP16.
+        """
+        try:
+            import torch
+            cuda_available = torch.cuda.is_available()
+        except ImportError:
+            cuda_available = False
+
+        if not cuda_available:
+            # CPU-only target: prefer an INT8 ONNX produced offline by
+            # apps/quantize_yolo_cpu.py. Ultralytics runs .onnx weights
+            # through onnxruntime, whose int8 kernels (AVX2/VNNI) beat
+            # fp32 PyTorch by 2-4x on x86 edge boxes.
+            int8_path = Path(model_name).with_suffix(".int8.onnx")
+            if int8_path.exists():
+                logger.info(f"Using INT8 ONNX model: {int8_path}")
+                return str(int8_path)
+            return model_name
+
+        engine_path = Path(model_name).with_suffix(".engine")
+        if not engine_path.exists():
+            try:
+                logger.info(f"Exporting {model_name} to TensorRT (one-time)...")
+                YOLO(model_name).export(
+                    format="engine", half=True, device=0, imgsz=640
+                )
+            except Exception as e:
+                logger.warning(f"TensorRT export failed, using {model_name}: {e}")
+                return model_name
+        
+        if engine_path.exists():
+            logger.info(f"Using TensorRT engine: {engine_path}")
+            return str(engine_path)
+        return model_name
+    
+    def detect(
+        self,
+        frame_id: int,
+        width: int,
+        height: int,
+        frame_data: bytes = None,
+        conf_threshold: float = None,
+        bgr: np.ndarray = None,
+    ) -> List[Detection]:
         """
         Detect objects in frame.
         
@@ -59,53 +138,112 @@ class YOLODetector:
             frame_id: Frame identifier (for logging)
             width: Frame width
             height: Frame height
-            frame_data: JPEG bytes (will be decoded)
+            frame_data: JPEG bytes (decoded only if bgr is absent)
+            conf_threshold: Confidence cutoff (defaults to the constructor value)
+            bgr: Already-decoded BGR pixels, if the source attached them
         
         Returns:
             List of Detection objects
         """
-        if frame_data is None:
-            logger.warning("No frame data provided to YOLO detector")
-            return []
+        results = self.detect_batch(
+            [(frame_id, width, height, frame_data, bgr)], conf_threshold
+        )
+        return results[0]
+    
+    def detect_batch(
+        self, frames: List[tuple], conf_threshold: float = None
+    ) -> List[List[Detection]]:
+        """
+        Detect objects in a batch of frames with one model call.
         
-        # Decode JPEG bytes to numpy array
-        import cv2
-        nparr = np.frombuffer(frame_data, np.uint8)
-        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        Ultralytics accepts a list of images and batches the forward pass
+        internally, so N frames cost roughly one kernel launch instead of N.
+        The confidence cutoff is applied inside the model (pre-NMS, on GPU),
+        so sub-threshold boxes are never materialized on the host.
         
-        if img is None:
-            logger.warning(f"Failed to decode frame {frame_id}")
-            return []
+        Frames that arrive with decoded BGR pixels skip the JPEG decode
+        entirely - the mp4/camera sources attach the array they already
+        decoded before encoding.
         
-        # Run YOLO detection
-        results = self.model(img, verbose=False)[0]
-        
-        detections = []
+        Args:
+            frames: List of (frame_id, width, height, jpg_bytes, bgr) tuples
+                where bgr may be None
+            conf_threshold: Confidence cutoff (defaults to the constructor value)
         
-        # Convert YOLO results to Detection objects
-        for box in results.boxes:
-            # Get bounding box coordinates (xyxy format)
-            x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-            
-            # Convert to normalized xywh format
-            x = float(x1 / width)
-            y = float(y1 / height)
-            w = float((x2 - x1) / width)
-            h = float((y2 - y1) / height)
+        Returns:
+            One Detection list per input frame, in order
+        """
+        if conf_threshold is None:
+            conf_threshold = self.conf_threshold
+        imgs = []
+        # Index into imgs for each input frame; None where decoding failed
+        slots: List[int] = []
+        
+        for frame_id, _width, _height, frame_data, bgr in frames:
+            if bgr is not None:
+                img = bgr
+            elif frame_data is not None:
+                nparr = np.frombuffer(frame_data, np.uint8)
+                img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            else:
+                logger.warning("No frame data provided to YOLO detector")
+                slots.append(None)
+                continue
             
-            # Get confidence and class
-            confidence = float(box.conf[0])
-            class_id = int(box.cls[0])
-            label = self.model.names[class_id]
+            if img is None:
+                logger.warning("Failed to decode frame %d", frame_id)
+                slots.append(None)
+                continue
             
-            detection = Detection(
-                label=label,
-                confidence=confidence,
-                bbox=(x, y, w, h)
-            )
-            detections.append(detection)
+            slots.append(len(imgs))
+            imgs.append(img)
+        
+        results = (
+            self.model(imgs, conf=conf_threshold, verbose=False) if imgs else []
+        )
+        
+        batch_detections = []
+        for (frame_id, width, height, _data, _bgr), slot in zip(frames, slots):
+            if slot is None:
+                batch_detections.append([])
+            else:
+                batch_detections.append(
+                    self._to_detections(results[slot], width, height)
+                )
+        
+        return batch_detections
+    
+    def _to_detections(self, result, width: int, height: int) -> List[Detection]:
+        """Convert one YOLO result to Detection objects.
         
-        return detections
+        Pulls the whole boxes tensor to the host in three copies instead of
+        one device sync per box, then normalizes coordinates in NumPy.
+        """
+        boxes = result.boxes
+        if len(boxes) == 0:
+            return []
+        
+        xyxy = boxes.xyxy.cpu().numpy()
+        confs = boxes.conf.cpu().numpy()
+        class_ids = boxes.cls.cpu().numpy().astype(np.int32)
+        
+        # Convert to normalized xywh format
+        xs = xyxy[:, 0] / width
+        ys = xyxy[:, 1] / height
+        ws = (xyxy[:, 2] - xyxy[:, 0]) / width
+        hs = (xyxy[:, 3] - xyxy[:, 1]) / height
+        
+        names = self.model.names
+        return [
+            Detection(
+                label=names[class_id],
+                confidence=float(conf),
+                bbox=(float(x), float(y), float(w), float(h)),
+            )
+            for class_id, conf, x, y, w, h in zip(
+                class_ids.tolist(), confs, xs, ys, ws, hs
+            )
+        ]
 
 
 class TFLiteDetector:
@@ -145,6 +283,23 @@ class TFLiteDetector:
         self.input_details = self.interpreter.get_input_details()
         self.output_details = self.interpreter.get_output_details()
         
+        # Resolve tensor indices once - get_tensor/set_tensor calls in the
+        # hot loop then skip the per-call detail-dict lookups
+        self._input_index = self.input_details[0]['index']
+        self._boxes_index = self.output_details[0]['index']
+        self._classes_index = self.output_details[1]['index']
+        self._scores_index = self.output_details[2]['index']
+        
+        # Preallocated staging buffers reused every frame: resize lands in
+        # the uint8 scratch, normalization writes into the model input
+        in_shape = self.input_details[0]['shape']
+        self._input_dtype = self.input_details[0]['dtype']
+        self._input_size = (int(in_shape[2]), int(in_shape[1]))  # (W, H)
+        self._input_buf = np.empty(tuple(in_shape), dtype=self._input_dtype)
+        self._resize_buf = np.empty(
+            (int(in_shape[1]), int(in_shape[2]), 3), dtype=np.uint8
+        )
+        
         # Load labels
         with open(labels_path, 'r') as f:
             self.labels = [line.strip() for line in f.readlines()]
@@ -153,8 +308,6 @@ class TFLiteDetector:
     
     def detect(self, frame_id: int, width: int, height: int, frame_data: bytes = None) -> List[Detection]:
         """Detect objects using TFLite model."""
-        import cv2
-        
         # Decode frame
         nparr = np.frombuffer(frame_data, np.uint8)
         img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
@@ -162,38 +315,55 @@ class TFLiteDetector:
         if img is None:
             return []
         
-        # Preprocess for model input
-        input_shape = self.input_details[0]['shape']
-        input_img = cv2.resize(img, (input_shape[1], input_shape[2]))
-        input_img = np.expand_dims(input_img, axis=0)
+        # Preprocess in place - no per-frame temporaries
+        cv2.resize(img, self._input_size, dst=self._resize_buf)
         
-        if self.input_details[0]['dtype'] == np.uint8:
-            input_img = input_img.astype(np.uint8)
+        if self._input_dtype == np.uint8:
+            np.copyto(self._input_buf[0], self._resize_buf)
         else:
-            input_img = (input_img.astype(np.float32) - 127.5) / 127.5
+            # (x - 127.5) / 127.5, written straight into the staging buffer
+            np.subtract(
+                self._resize_buf, 127.5, out=self._input_buf[0],
+                dtype=np.float32, casting="unsafe",
+            )
+            np.multiply(
+                self._input_buf, 1.0 / 127.5, out=self._input_buf
+            )
         
         # Run inference
-        self.interpreter.set_tensor(self.input_details[0]['index'], input_img)
+        self.interpreter.set_tensor(self._input_index, self._input_buf)
         self.interpreter.invoke()
         
         # Get outputs
-        boxes = self.interpreter.get_tensor(self.output_details[0]['index'])[0]
-        classes = self.interpreter.get_tensor(self.output_details[1]['index'])[0]
-        scores = self.interpreter.get_tensor(self.output_details[2]['index'])[0]
-        
-        detections = []
-        for i in range(len(scores)):
-            if scores[i] > 0.5:  # Confidence threshold
-                y1, x1, y2, x2 = boxes[i]
-                
-                detection = Detection(
-                    label=self.labels[int(classes[i])],
-                    confidence=float(scores[i]),
-                    bbox=(float(x1), float(y1), float(x2 - x1), float(y2 - y1))
-                )
-                detections.append(detection)
+        boxes = self.interpreter.get_tensor(self._boxes_index)[0]
+        classes = self.interpreter.get_tensor(self._classes_index)[0]
+        scores = self.interpreter.get_tensor(self._scores_index)[0]
         
-        return detections
+        # Vectorized confidence cut + gather instead of a Python row loop
+        keep = scores > 0.5
+        if not np.any(keep):
+            return []
+        
+        kept_boxes = boxes[keep]  # rows are (y1, x1, y2, x2)
+        kept_scores = scores[keep]
+        kept_classes = classes[keep].astype(np.int32)
+        
+        xs = kept_boxes[:, 1]
+        ys = kept_boxes[:, 0]
+        ws = kept_boxes[:, 3] - kept_boxes[:, 1]
+        hs = kept_boxes[:, 2] - kept_boxes[:, 0]
+        
+        labels = self.labels
+        return [
+            Detection(
+                label=labels[class_id],
+                confidence=float(score),
+                bbox=(float(x), float(y), float(w), float(h)),
+            )
+            for class_id, score, x, y, w, h in zip(
+                kept_classes.tolist(), kept_scores, xs, ys, ws, hs
+            )
+        ]
 
 
 class OpenCVDNNDetector:
@@ -218,8 +388,6 @@ class OpenCVDNNDetector:
             labels_path: Path to class labels
             framework: "darknet", "tensorflow", or "caffe"
         """
-        import cv2
-        
         # Load model
         if framework == "darknet":
             self.net = cv2.dnn.readNetFromDarknet(config_path, model_path)
@@ -252,8 +420,6 @@ class OpenCVDNNDetector:
     
     def detect(self, frame_id: int, width: int, height: int, frame_data: bytes = None) -> List[Detection]:
         """Detect objects using OpenCV DNN."""
-        import cv2
-        
         # Decode frame
         nparr = np.frombuffer(frame_data, np.uint8)
         img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
@@ -268,30 +434,44 @@ class OpenCVDNNDetector:
         # Forward pass
         outputs = self.net.forward(self.output_layers)
         
-        detections = []
-        for output in outputs:
-            for detection in output:
-                scores = detection[5:]
-                class_id = np.argmax(scores)
-                confidence = scores[class_id]
-                
-                if confidence > 0.5:
-                    # Get bbox
-                    center_x = detection[0]
-                    center_y = detection[1]
-                    w = detection[2]
-                    h = detection[3]
-                    
-                    # Convert to top-left corner format
-                    x = center_x - w / 2
-                    y = center_y - h / 2
-                    
-                    det = Detection(
-                        label=self.labels[class_id],
-                        confidence=float(confidence),
-                        bbox=(float(x), float(y), float(w), float(h))
-                    )
-                    detections.append(det)
-        
-        return detections
+        # One vectorized pass over all output rows instead of a Python
+        # argmax per box - with the CUDA target, per-box Python loops were
+        # the bottleneck, not the network
+        cat = np.concatenate([o.reshape(-1, o.shape[-1]) for o in outputs])
+        class_scores = cat[:, 5:]
+        class_ids = class_scores.argmax(axis=1)
+        confidences = class_scores[np.arange(len(cat)), class_ids]
+        
+        keep = confidences > 0.5
+        if not np.any(keep):
+            return []
+        
+        rows = cat[keep]
+        class_ids = class_ids[keep]
+        confidences = confidences[keep]
+        
+        # Convert center format to top-left corner format
+        ws = rows[:, 2]
+        hs = rows[:, 3]
+        xs = rows[:, 0] - ws / 2
+        ys = rows[:, 1] - hs / 2
+        boxes = np.stack([xs, ys, ws, hs], axis=1)
+        
+        # Suppress overlapping boxes (OpenCV's C implementation)
+        nms_idxs = cv2.dnn.NMSBoxes(
+            boxes.tolist(), confidences.tolist(), 0.5, 0.45
+        )
+        if len(nms_idxs) == 0:
+            return []
+        
+        return [
+            Detection(
+                label=self.labels[class_ids[i]],
+                confidence=float(confidences[i]),
+                bbox=(
+                    float(xs[i]), float(ys[i]), float(ws[i]), float(hs[i])
+                ),
+            )
+            for i in np.asarray(nms_idxs).flatten()
+        ]
 
@@ -1,7 +1,12 @@
 """YOLOv8-World detector with custom classes (open vocabulary detection)."""
 
+import asyncio
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List
+import cv2
 import numpy as np
 from contracts.schemas import Detection
 
@@ -14,6 +19,18 @@ except ImportError:
     YOLO_WORLD_AVAILABLE = False
     logger.warning("YOLOWorld not available (requires ultralytics>=8.0.238)")
 
+# libjpeg-turbo decodes 2-4x faster than OpenCV's bundled libjpeg at
+# 1080p; fall back to cv2.imdecode when the binding isn't installed
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+# Slot marker: frame was perceptually identical to the last inferred one,
+# so its result is the cached detection list rather than a model output
+_REUSE_LAST = -1
+
 
 class YOLOWorldDetector:
     """
@@ -28,15 +45,26 @@ class YOLOWorldDetector:
     def __init__(
         self,
         model_name: str = "yolov8s-world.pt",
-        custom_classes: List[str] = None
+        custom_classes: List[str] = None,
+        accelerate: bool = True,
+        max_batch: int = 4,
+        dhash_threshold: int = 6,
     ):
         """
         Initialize YOLO-World detector.
-        
+
         Args:
             model_name: Model to use (yolov8s-world.pt, yolov8m-world.pt, yolov8l-world.pt)
             custom_classes: List of custom object names to detect
                            e.g., ["keys", "charger", "cable", "wallet", "glasses"]
+            accelerate: On CUDA targets, export and reuse a static-shape FP16
+                TensorRT engine keyed by the class vocabulary
+            max_batch: Largest batch detect_batch will see; the exported
+                engine is built for this size so TensorRT picks
+                batch-optimal kernels
+            dhash_threshold: Reuse the previous frame's detections when the
+                perceptual-hash distance to the last inferred frame is
+                below this (0 disables the gate)
         """
         if not YOLO_WORLD_AVAILABLE:
             raise ImportError(
@@ -58,6 +86,17 @@ class YOLOWorldDetector:
             ]
         
         self.custom_classes = custom_classes
+        self.max_batch = max_batch
+
+        # Perceptual-hash gate: a wearer standing still produces long runs
+        # of near-identical frames, and a 64-bit dHash compare is ~6 orders
+        # of magnitude cheaper than a forward pass
+        self.dhash_threshold = dhash_threshold
+        self._last_hash: "int | None" = None
+        self._last_detections: List[Detection] = []
+
+        # One decoder instance reused across frames
+        self._turbojpeg = TurboJPEG() if TURBOJPEG_AVAILABLE else None
         
         logger.info(f"Loading YOLO-World model: {model_name}")
         self.model = YOLOWorld(model_name)
@@ -65,74 +104,249 @@ class YOLOWorldDetector:
         # Set custom classes
         self.model.set_classes(custom_classes)
         
+        self._accelerate = accelerate
+        self._engine_loaded = False
+        self._engine_stale = False
+        if accelerate:
+            self._try_load_engine()
+
+        # Single worker: one GPU, so inference is serialized anyway, and a
+        # dedicated thread keeps every forward pass on the same CUDA context
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="yolo-world"
+        )
+        
         logger.info(f"✓ YOLO-World loaded with {len(custom_classes)} custom classes")
         logger.info(f"  Detecting: {', '.join(custom_classes[:10])}...")
     
+    def _engine_path(self) -> Path:
+        """Engine cache location, keyed by model plus class vocabulary.
+        
+        set_classes bakes the CLIP text embeddings into the exported graph,
+        so an engine is only valid for the exact class list it was built
+        with - hence the digest in the filename.
+        """
+        digest = hashlib.sha1(
+            "\n".join(self.custom_classes).encode()
+        ).hexdigest()[:12]
+        base = Path(self.model_name)
+        return base.with_name(f"{base.stem}.{digest}.b{self.max_batch}.engine")
+    
+    def _try_load_engine(self) -> None:
+        """Export (once) and load the FP16 TensorRT engine on CUDA targets.
+
+        Static shape (imgsz=640, batch=max_batch) - TensorRT picks notably
+        faster kernels than for dynamic shapes. Any failure leaves the
+        PyTorch model in place.
+        """
+        try:
+            import torch
+            if not torch.cuda.is_available():
+                return
+        except ImportError:
+            return
+        
+        engine_path = self._engine_path()
+        if not engine_path.exists():
+            try:
+                logger.info(f"Exporting YOLO-World TensorRT engine (one-time)...")
+                exported = self.model.export(
+                    format="engine",
+                    half=True,
+                    device=0,
+                    imgsz=640,
+                    batch=self.max_batch,
+                )
+                Path(exported).rename(engine_path)
+            except Exception as e:
+                logger.warning(f"TensorRT export failed, staying on PyTorch: {e}")
+                return
+        
+        try:
+            self.model = YOLOWorld(str(engine_path))
+            self._engine_loaded = True
+            logger.info(f"Using TensorRT engine: {engine_path}")
+        except Exception as e:
+            logger.warning(f"Failed to load engine {engine_path}: {e}")
+    
+    def decode_frame(self, frame_data: bytes) -> "np.ndarray | None":
+        """Decode JPEG bytes to BGR (SIMD path when libjpeg-turbo is available).
+
+        Split out from detect so a caller can run decode in a separate
+        executor/thread stage and overlap it with the previous frame's
+        inference, then pass the pixels back via detect(bgr=...).
+        """
+        if self._turbojpeg is not None:
+            return self._turbojpeg.decode(frame_data, pixel_format=TJPF_BGR)
+        nparr = np.frombuffer(frame_data, np.uint8)
+        return cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+
+    @staticmethod
+    def _dhash(img: np.ndarray) -> int:
+        """64-bit difference hash of a BGR frame.
+
+        Shrink to 9x8, then compare horizontal neighbours - robust to
+        noise and compression, sensitive to actual scene change.
+        """
+        small = cv2.resize(img, (9, 8), interpolation=cv2.INTER_AREA).mean(axis=2)
+        bits = (small[:, 1:] > small[:, :-1]).astype(np.uint8)
+        return int(np.packbits(bits).view(np.uint64)[0])
+
     def detect(
         self,
         frame_id: int,
         width: int,
         height: int,
-        frame_data: bytes = None
+        frame_data: bytes = None,
+        bgr: "np.ndarray | None" = None,
     ) -> List[Detection]:
         """
         Detect custom objects in frame.
-        
+
         Args:
             frame_id: Frame identifier
             width: Frame width
             height: Frame height
             frame_data: JPEG bytes
-        
+            bgr: Pre-decoded BGR pixels; skips the JPEG decode stage when a
+                pipeline already ran decode_frame (or the source kept them)
+
         Returns:
             List of Detection objects
         """
-        if frame_data is None:
-            logger.warning("No frame data provided")
-            return []
-        
-        # Decode JPEG bytes
-        import cv2
-        nparr = np.frombuffer(frame_data, np.uint8)
-        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        
-        if img is None:
-            logger.warning(f"Failed to decode frame {frame_id}")
+        results = self.detect_batch([(frame_id, width, height, frame_data, bgr)])
+        return results[0]
+
+    def detect_batch(self, frames: List[tuple]) -> List[List[Detection]]:
+        """
+        Detect custom objects in a batch of frames with one model call.
+
+        Ultralytics batches the forward pass over a list of images, so N
+        frames cost roughly one kernel launch instead of N - and the
+        exported engine is built for max_batch, so TensorRT runs a
+        batch-optimal plan. Callers should keep batches at max_batch or
+        smaller.
+
+        Args:
+            frames: List of (frame_id, width, height, jpg_bytes, bgr)
+                tuples where bgr may be None
+
+        Returns:
+            One Detection list per input frame, in order
+        """
+        # Class vocabulary changed since the engine was built - re-export
+        # lazily here rather than stalling update_classes
+        if self._engine_stale:
+            self._engine_stale = False
+            self._try_load_engine()
+
+        imgs = []
+        # Index into imgs for each input frame; None where decoding failed
+        slots: List[int] = []
+
+        for frame_id, _width, _height, frame_data, bgr in frames:
+            if bgr is not None:
+                img = bgr
+            elif frame_data is not None:
+                img = self.decode_frame(frame_data)
+            else:
+                logger.warning("No frame data provided")
+                slots.append(None)
+                continue
+
+            if img is None:
+                logger.warning(f"Failed to decode frame {frame_id}")
+                slots.append(None)
+                continue
+
+            # Visually unchanged since the last inferred frame - reuse its
+            # detections. The reference hash advances only when inference
+            # runs, so slow drift accumulates past the threshold instead
+            # of being absorbed one sub-threshold step at a time.
+            if self.dhash_threshold > 0:
+                frame_hash = self._dhash(img)
+                if (
+                    self._last_hash is not None
+                    and (frame_hash ^ self._last_hash).bit_count()
+                    < self.dhash_threshold
+                ):
+                    slots.append(_REUSE_LAST)
+                    continue
+                self._last_hash = frame_hash
+
+            slots.append(len(imgs))
+            imgs.append(img)
+
+        results = self.model(imgs, verbose=False) if imgs else []
+
+        batch_detections = []
+        for (_fid, width, height, _data, _bgr), slot in zip(frames, slots):
+            if slot is None:
+                batch_detections.append([])
+            elif slot == _REUSE_LAST:
+                # Detection is frozen, so sharing instances across frames
+                # is safe by design
+                batch_detections.append(self._last_detections)
+            else:
+                detections = self._to_detections(results[slot], width, height)
+                self._last_detections = detections
+                batch_detections.append(detections)
+
+        return batch_detections
+
+    async def detect_async(
+        self,
+        frame_id: int,
+        width: int,
+        height: int,
+        frame_data: bytes = None,
+        bgr: "np.ndarray | None" = None,
+    ) -> List[Detection]:
+        """Run detect on the inference worker thread.
+
+        The forward pass blocks for 10-50 ms; awaiting it here keeps the
+        event loop free to service the frame and result buses meanwhile.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            lambda: self.detect(frame_id, width, height, frame_data, bgr),
+        )
+
+    def _to_detections(self, results, width: int, height: int) -> List[Detection]:
+        """Convert one frame's raw model output to Detection objects."""
+        boxes = results.boxes
+        if len(boxes) == 0:
             return []
         
-        # Run YOLO-World detection
-        results = self.model(img, verbose=False)[0]
+        # Three whole-tensor device-to-host copies instead of one CUDA
+        # sync per box
+        xyxy = boxes.xyxy.cpu().numpy()
+        confs = boxes.conf.cpu().numpy()
+        class_ids = boxes.cls.cpu().numpy().astype(np.int32)
         
-        detections = []
+        # Convert to normalized xywh
+        xs = xyxy[:, 0] / width
+        ys = xyxy[:, 1] / height
+        ws = (xyxy[:, 2] - xyxy[:, 0]) / width
+        hs = (xyxy[:, 3] - xyxy[:, 1]) / height
         
-        for box in results.boxes:
-            # Get bounding box
-            x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-            
-            # Convert to normalized xywh
-            x = float(x1 / width)
-            y = float(y1 / height)
-            w = float((x2 - x1) / width)
-            h = float((y2 - y1) / height)
-            
-            # Get confidence and class
-            confidence = float(box.conf[0])
-            class_id = int(box.cls[0])
-            
-            # Get label from custom classes
-            if class_id < len(self.custom_classes):
-                label = self.custom_classes[class_id]
-            else:
-                label = f"object_{class_id}"
-            
-            detection = Detection(
-                label=label,
-                confidence=confidence,
-                bbox=(x, y, w, h)
+        custom_classes = self.custom_classes
+        n_classes = len(custom_classes)
+        return [
+            Detection(
+                label=(
+                    custom_classes[class_id]
+                    if class_id < n_classes
+                    else f"object_{class_id}"
+                ),
+                confidence=float(conf),
+                bbox=(float(x), float(y), float(w), float(h)),
             )
-            detections.append(detection)
-        
-        return detections
+            for class_id, conf, x, y, w, h in zip(
+                class_ids.tolist(), confs, xs, ys, ws, hs
+            )
+        ]
     
     def update_classes(self, new_classes: List[str]) -> None:
         """
@@ -148,7 +362,15 @@ class YOLOWorldDetector:
             detector.update_classes(["car", "bicycle", "person", "dog"])
         """
         self.custom_classes = new_classes
+        
+        if self._engine_loaded:
+            # The engine is baked for the old vocabulary - fall back to
+            # the PyTorch model until a fresh engine is built
+            self.model = YOLOWorld(self.model_name)
+            self._engine_loaded = False
+        
         self.model.set_classes(new_classes)
+        self._engine_stale = self._accelerate
         logger.info(f"Updated classes: {', '.join(new_classes)}")
 
 
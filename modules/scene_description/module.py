@@ -2,8 +2,9 @@
 
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional
-from collections import defaultdict
+from collections import Counter, OrderedDict
 from modules.base import BaseModule
 from contracts.schemas import TrackUpdate, SceneDescription
 from core_platform.result_bus import ResultBus
@@ -11,6 +12,26 @@ from core_platform.control_state import ControlState
 
 logger = logging.getLogger(__name__)
 
+# Label -> "a <label>" / "<label>s" phrases, built lazily; the label
+# vocabulary is tiny and stable, so this caps string interpolation at
+# one of each per distinct label over the process lifetime
+_SINGULARS: Dict[str, str] = {}
+_PLURALS: Dict[str, str] = {}
+
+
+def _singular(label: str) -> str:
+    phrase = _SINGULARS.get(label)
+    if phrase is None:
+        phrase = _SINGULARS[label] = f"a {label}"
+    return phrase
+
+
+def _plural(label: str) -> str:
+    plural = _PLURALS.get(label)
+    if plural is None:
+        plural = _PLURALS[label] = f"{label}s"
+    return plural
+
 
 class SceneDescriptionModule(BaseModule):
     """
@@ -39,8 +60,10 @@ class SceneDescriptionModule(BaseModule):
         self.result_bus: Optional[ResultBus] = None
         self.control_state: Optional[ControlState] = None
         
-        # Track state
-        self.active_tracks: Dict[int, TrackUpdate] = {}
+        # Track state, ordered oldest-update-first: each upsert moves the
+        # track to the end, so stale eviction pops from the front and stops
+        # at the first fresh entry instead of scanning every track
+        self.active_tracks: "OrderedDict[int, TrackUpdate]" = OrderedDict()
         self.last_description_time: float = 0
     
     async def start(
@@ -69,21 +92,24 @@ class SceneDescriptionModule(BaseModule):
                 if not self.running:
                     break
                 
-                # Update or add track
+                # Update or add track; freshest entries live at the end
                 self.active_tracks[event.track_id] = event
-                
-                # Remove stale tracks (not updated in last 3 seconds)
-                import time
-                current_time = time.time() * 1000  # ms
+                self.active_tracks.move_to_end(event.track_id)
+
+                # Remove stale tracks (not updated in last 3 seconds).
+                # Insertion order is update order, so popping from the
+                # front until a fresh entry appears evicts every stale one.
+                # The event's own timestamp stands in for "now" - no
+                # per-event clock syscall, and staleness stays monotonic
+                # with the frame stream even during replay.
+                current_time = event.timestamp_ms
                 stale_threshold = 3000  # 3 seconds
-                
-                stale_ids = [
-                    tid for tid, track in self.active_tracks.items()
-                    if current_time - track.timestamp_ms > stale_threshold
-                ]
-                
-                for tid in stale_ids:
-                    del self.active_tracks[tid]
+
+                while self.active_tracks:
+                    oldest = next(iter(self.active_tracks.values()))
+                    if current_time - oldest.timestamp_ms <= stale_threshold:
+                        break
+                    self.active_tracks.popitem(last=False)
         
         except Exception as e:
             logger.error(f"{self.name} tracking error: {e}", exc_info=True)
@@ -100,7 +126,6 @@ class SceneDescriptionModule(BaseModule):
                 description = self._describe_scene()
                 
                 if description:
-                    import time
                     scene_desc = SceneDescription(
                         timestamp_ms=int(time.time() * 1000),
                         description=description,
@@ -118,72 +143,64 @@ class SceneDescriptionModule(BaseModule):
         """Generate natural language description of current scene."""
         if not self.active_tracks:
             return None
-        
-        # Group objects by location
-        by_zone = defaultdict(list)
-        by_direction = defaultdict(list)
-        
+
+        # Count labels per direction (plus the near zone) in a single pass
+        # instead of building intermediate label lists and re-counting them
+        dir_counts = {d: Counter() for d in ("center", "left", "right")}
+        near_counts: Counter = Counter()
+
         for track in self.active_tracks.values():
-            direction = track.direction or "center"
-            zone = track.zone or "mid"
             label = track.label
-            
-            by_direction[direction].append(label)
-            by_zone[zone].append(label)
-        
+            dir_counts[track.direction or "center"][label] += 1
+            if track.zone == "near":
+                near_counts[label] += 1
+
         # Build description
         parts = []
-        
+
         # Start with overall count
         total = len(self.active_tracks)
         if total == 1:
             parts.append("One object detected")
         else:
             parts.append(f"{total} objects detected")
-        
+
         # Describe by direction (most important)
-        dir_order = ["center", "left", "right"]
         dir_descriptions = []
-        
-        for direction in dir_order:
-            if direction in by_direction:
-                objects = by_direction[direction]
-                obj_summary = self._summarize_objects(objects)
-                
+
+        for direction in ("center", "left", "right"):
+            counts = dir_counts[direction]
+            if counts:
+                obj_summary = self._summarize_objects(counts)
+
                 if direction == "center":
                     dir_descriptions.append(f"{obj_summary} ahead")
                 else:
                     dir_descriptions.append(f"{obj_summary} on the {direction}")
-        
+
         if dir_descriptions:
             parts.append(": " + ", ".join(dir_descriptions))
-        
+
         # Add urgency note if any objects are near
-        near_objects = by_zone.get("near", [])
-        if near_objects:
-            near_summary = self._summarize_objects(near_objects)
+        if near_counts:
+            near_summary = self._summarize_objects(near_counts)
             parts.append(f". {near_summary} nearby")
-        
+
         return "".join(parts)
-    
-    def _summarize_objects(self, objects: List[str]) -> str:
-        """Summarize a list of object labels."""
-        if not objects:
+
+    def _summarize_objects(self, counts: "Counter[str]") -> str:
+        """Summarize label counts into a phrase."""
+        if not counts:
             return ""
-        
-        # Count occurrences
-        counts = defaultdict(int)
-        for obj in objects:
-            counts[obj] += 1
-        
+
         # Format
         items = []
         for obj, count in counts.items():
             if count == 1:
-                items.append(f"a {obj}")
+                items.append(_singular(obj))
             else:
-                items.append(f"{count} {obj}s")
-        
+                items.append(f"{count} {_plural(obj)}")
+
         if len(items) == 1:
             return items[0]
         elif len(items) == 2:
@@ -0,0 +1,52 @@
+"""Pairwise IoU kernel, Numba-compiled when available.
+
+The broadcasting path in matching.py allocates several N*M temporaries
+per frame; this kernel fuses the whole computation into one loop writing
+a preallocated output buffer. Only worth it with Numba - as plain Python
+the loop would be slower than broadcasting, so callers must check
+NUMBA_AVAILABLE.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def iou_kernel(det, trk, out):
+    """Fill out[i, j] with IoU of det[i] and trk[j].
+
+    det rows are (x, y, w, h); trk rows are already (x1, y1, x2, y2) -
+    the tracker caches corner form so only the detection side converts.
+    """
+    for i in prange(det.shape[0]):
+        dx1 = det[i, 0]
+        dy1 = det[i, 1]
+        dw = det[i, 2]
+        dh = det[i, 3]
+        dx2 = dx1 + dw
+        dy2 = dy1 + dh
+        d_area = dw * dh
+
+        for j in range(trk.shape[0]):
+            ix1 = max(dx1, trk[j, 0])
+            iy1 = max(dy1, trk[j, 1])
+            ix2 = min(dx2, trk[j, 2])
+            iy2 = min(dy2, trk[j, 3])
+
+            iw = ix2 - ix1
+            ih = iy2 - iy1
+            if iw <= 0.0 or ih <= 0.0:
+                out[i, j] = 0.0
+                continue
+
+            inter = iw * ih
+            t_area = (trk[j, 2] - trk[j, 0]) * (trk[j, 3] - trk[j, 1])
+            union = d_area + t_area - inter
+            out[i, j] = inter / union if union > 0.0 else 0.0
+
+
+if NUMBA_AVAILABLE:
+    iou_kernel = njit(parallel=True, cache=True)(iou_kernel)
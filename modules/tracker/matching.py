@@ -1,5 +1,22 @@
 """Matching utilities for tracking."""
 
+import numpy as np
+
+# Optimal assignment via SciPy's Jonker-Volgenant implementation when
+# available; the greedy matcher below remains as the fallback.
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from modules.tracker._iou_kernel import NUMBA_AVAILABLE, iou_kernel
+
+# Scratch matrix reused across frames by the fused kernel; the tracker
+# consumes each matrix before the next frame, so reuse is safe. Grows
+# monotonically to the largest (N, M) seen.
+_iou_scratch = np.empty((0, 0), dtype=np.float32)
+
 
 def compute_iou(bbox1: tuple[float, float, float, float],
                 bbox2: tuple[float, float, float, float]) -> float:
@@ -14,47 +31,121 @@ def compute_iou(bbox1: tuple[float, float, float, float],
     """
     x1, y1, w1, h1 = bbox1
     x2, y2, w2, h2 = bbox2
+
+    # Intersection extents straight from xywh - no intermediate corner
+    # tuples, and each axis early-exits before touching the other
+    iw = min(x1 + w1, x2 + w2) - max(x1, x2)
+    if iw <= 0.0:
+        return 0.0
+    ih = min(y1 + h1, y2 + h2) - max(y1, y2)
+    if ih <= 0.0:
+        return 0.0
+
+    inter_area = iw * ih
+    union_area = w1 * h1 + w2 * h2 - inter_area
+    return inter_area / union_area if union_area > 0.0 else 0.0
+
+
+def iou_matrix(det_boxes: np.ndarray, trk_xyxy: np.ndarray) -> np.ndarray:
+    """
+    Compute the dense IoU matrix for all detection/track pairs at once.
     
-    # Convert to (x1, y1, x2, y2) format
-    box1_x1, box1_y1 = x1, y1
-    box1_x2, box1_y2 = x1 + w1, y1 + h1
-    
-    box2_x1, box2_y1 = x2, y2
-    box2_x2, box2_y2 = x2 + w2, y2 + h2
-    
-    # Compute intersection
-    inter_x1 = max(box1_x1, box2_x1)
-    inter_y1 = max(box1_y1, box2_y1)
-    inter_x2 = min(box1_x2, box2_x2)
-    inter_y2 = min(box1_y2, box2_y2)
+    With Numba installed this is one fused parallel loop into a reused
+    scratch buffer (no temporaries); otherwise NumPy broadcasting replaces
+    the N*M Python calls to compute_iou with a handful of array
+    operations. compute_iou remains as the scalar reference.
     
-    if inter_x2 <= inter_x1 or inter_y2 <= inter_y1:
-        return 0.0
+    Track boxes arrive pre-converted to corner form (the tracker caches
+    xyxy per track), so only the detection side pays the x+w/y+h adds.
     
-    inter_area = (inter_x2 - inter_x1) * (inter_y2 - inter_y1)
+    Args:
+        det_boxes: (N, 4) array of (x, y, w, h) rows
+        trk_xyxy: (M, 4) array of (x1, y1, x2, y2) rows
     
-    # Compute union
-    box1_area = w1 * h1
-    box2_area = w2 * h2
-    union_area = box1_area + box2_area - inter_area
+    Returns:
+        (N, M) float array of IoU scores
+    """
+    global _iou_scratch
+    n, m = det_boxes.shape[0], trk_xyxy.shape[0]
+    if _iou_scratch.shape[0] < n or _iou_scratch.shape[1] < m:
+        _iou_scratch = np.empty(
+            (max(n, _iou_scratch.shape[0]), max(m, _iou_scratch.shape[1])),
+            dtype=np.float32,
+        )
+    out = _iou_scratch[:n, :m]
+
+    if NUMBA_AVAILABLE:
+        iou_kernel(det_boxes, trk_xyxy, out)
+        return out
+
+    if n * m < 64:
+        # At a handful of pairs the fixed cost of the broadcasting
+        # pipeline (a dozen array ops plus temporaries) dominates the
+        # arithmetic; a plain scalar loop over floats wins. Pull the
+        # rows out as Python floats once so the inner loop never touches
+        # NumPy scalars.
+        det_rows = det_boxes.tolist()
+        trk_rows = trk_xyxy.tolist()
+        for i, (dx1, dy1, dw, dh) in enumerate(det_rows):
+            dx2 = dx1 + dw
+            dy2 = dy1 + dh
+            d_area = dw * dh
+            for j, (tx1, ty1, tx2, ty2) in enumerate(trk_rows):
+                iw = min(dx2, tx2) - max(dx1, tx1)
+                ih = min(dy2, ty2) - max(dy1, ty1)
+                if iw <= 0.0 or ih <= 0.0:
+                    out[i, j] = 0.0
+                    continue
+                inter = iw * ih
+                union = d_area + (tx2 - tx1) * (ty2 - ty1) - inter
+                out[i, j] = inter / union if union > 0.0 else 0.0
+        return out
+
+    dx2 = det_boxes[:, 0] + det_boxes[:, 2]
+    dy2 = det_boxes[:, 1] + det_boxes[:, 3]
     
-    if union_area == 0:
-        return 0.0
+    ix1 = np.maximum(det_boxes[:, None, 0], trk_xyxy[None, :, 0])
+    iy1 = np.maximum(det_boxes[:, None, 1], trk_xyxy[None, :, 1])
+    ix2 = np.minimum(dx2[:, None], trk_xyxy[None, :, 2])
+    iy2 = np.minimum(dy2[:, None], trk_xyxy[None, :, 3])
     
-    return inter_area / union_area
+    inter = np.clip(ix2 - ix1, 0.0, None) * np.clip(iy2 - iy1, 0.0, None)
+
+    det_area = det_boxes[:, 2] * det_boxes[:, 3]
+    trk_area = (trk_xyxy[:, 2] - trk_xyxy[:, 0]) * (trk_xyxy[:, 3] - trk_xyxy[:, 1])
+    union = det_area[:, None] + trk_area[None, :] - inter
+
+    # Most det/track pairs in a spread-out scene don't overlap at all
+    # (inter == 0); dividing only where they do leaves those entries at
+    # the zero fill and skips the needless divides. inter > 0 implies
+    # union > 0, so the guard also covers degenerate boxes.
+    return np.divide(
+        inter, union, out=np.zeros_like(inter), where=inter > 0
+    )
+
+
+def warmup() -> None:
+    """Compile the IoU kernel off the hot path (no-op without Numba)."""
+    if NUMBA_AVAILABLE:
+        iou_matrix(
+            np.zeros((1, 4), dtype=np.float32),
+            np.zeros((1, 4), dtype=np.float32),
+        )
 
 
 def match_detections_to_tracks(
     detections: list[tuple[int, tuple[float, float, float, float]]],
-    tracks: dict[int, tuple[float, float, float, float]],
+    track_ids: list[int],
+    trk_xyxy: np.ndarray,
     iou_threshold: float = 0.3,
 ) -> tuple[dict[int, int], list[int], list[int]]:
     """
     Match detections to existing tracks using IoU.
     
     Args:
-        detections: List of (detection_idx, bbox) tuples
-        tracks: Dict of {track_id: bbox}
+        detections: List of (detection_idx, bbox) tuples, bbox as (x, y, w, h)
+        track_ids: Active track ids, aligned with trk_xyxy rows
+        trk_xyxy: (M, 4) corner boxes from Tracker.get_active_tracks_xyxy()
         iou_threshold: Minimum IoU for a match
     
     Returns:
@@ -63,39 +154,49 @@ def match_detections_to_tracks(
         - unmatched_detections: List of detection indices
         - unmatched_tracks: List of track IDs
     """
-    if not detections or not tracks:
+    if not detections or not track_ids:
         unmatched_det = [d[0] for d in detections]
-        unmatched_trk = list(tracks.keys())
-        return {}, unmatched_det, unmatched_trk
-    
-    # Compute IoU matrix
-    iou_matrix = {}
-    for det_idx, det_bbox in detections:
-        for track_id, track_bbox in tracks.items():
-            iou = compute_iou(det_bbox, track_bbox)
-            if iou >= iou_threshold:
-                iou_matrix[(det_idx, track_id)] = iou
-    
-    # Greedy matching (highest IoU first)
+        return {}, unmatched_det, list(track_ids)
+    
+    det_indices = [d[0] for d in detections]
+    det_boxes = np.asarray([b for _, b in detections], dtype=np.float32)
+    
+    # One vectorized pass for all pairwise IoUs
+    iou = iou_matrix(det_boxes, trk_xyxy)
+    
     matches = {}
     matched_detections = set()
     matched_tracks = set()
     
-    # Sort by IoU descending
-    sorted_pairs = sorted(iou_matrix.items(), key=lambda x: x[1], reverse=True)
-    
-    for (det_idx, track_id), iou in sorted_pairs:
-        if det_idx not in matched_detections and track_id not in matched_tracks:
-            matches[det_idx] = track_id
-            matched_detections.add(det_idx)
-            matched_tracks.add(track_id)
+    if SCIPY_AVAILABLE:
+        # Globally optimal assignment (minimizes total 1-IoU cost); fewer
+        # ID switches than greedy when boxes overlap ambiguously
+        rows, cols = linear_sum_assignment(1.0 - iou)
+        for row, col in zip(rows, cols):
+            if iou[row, col] >= iou_threshold:
+                det_idx = det_indices[row]
+                track_id = track_ids[col]
+                matches[det_idx] = track_id
+                matched_detections.add(det_idx)
+                matched_tracks.add(track_id)
+    else:
+        # Candidate pairs above threshold, greedily taken highest IoU first
+        candidates = np.argwhere(iou >= iou_threshold)
+        order = np.argsort(iou[candidates[:, 0], candidates[:, 1]])[::-1]
+        
+        for row, col in candidates[order]:
+            det_idx = det_indices[row]
+            track_id = track_ids[col]
+            if det_idx not in matched_detections and track_id not in matched_tracks:
+                matches[det_idx] = track_id
+                matched_detections.add(det_idx)
+                matched_tracks.add(track_id)
     
     # Identify unmatched
-    all_det_indices = {d[0] for d in detections}
-    all_track_ids = set(tracks.keys())
-    
-    unmatched_detections = list(all_det_indices - matched_detections)
-    unmatched_tracks = list(all_track_ids - matched_tracks)
+    unmatched_detections = [
+        d for d in det_indices if d not in matched_detections
+    ]
+    unmatched_tracks = [t for t in track_ids if t not in matched_tracks]
     
     return matches, unmatched_detections, unmatched_tracks
 
@@ -3,10 +3,13 @@
 import asyncio
 import logging
 from typing import Optional
+
+import numpy as np
+
 from modules.base import BaseModule
 from modules.tracker.tracker import Tracker
-from modules.tracker.matching import match_detections_to_tracks
-from contracts.schemas import DetectionResult, TrackUpdate
+from modules.tracker.matching import match_detections_to_tracks, warmup
+from contracts.schemas import DetectionResult, TrackUpdate, TrackBatch
 from core_platform.frame_bus import FrameBus
 from core_platform.result_bus import ResultBus
 from core_platform.control_state import ControlState
@@ -18,7 +21,8 @@ class TrackerModule(BaseModule):
     """
     Multi-object tracking module.
     
-    Subscribes to DetectionResult and publishes TrackUpdate.
+    Subscribes to DetectionResult and publishes per-track TrackUpdate
+    events plus one columnar TrackBatch per frame for batch consumers.
     """
     
     name = "Tracker"
@@ -40,6 +44,9 @@ class TrackerModule(BaseModule):
         self.control_state = control_state
         self.running = True
         
+        # Compile the IoU kernel now rather than on the first frame
+        warmup()
+        
         task = asyncio.create_task(self._process_detections())
         logger.info(f"{self.name} module started")
         return [task]
@@ -57,18 +64,20 @@ class TrackerModule(BaseModule):
                     for idx, det in enumerate(event.objects)
                 ]
                 
-                # Get current tracks
-                active_tracks = self.tracker.get_active_tracks()
+                # Get current tracks (ids + reused corner-box buffer)
+                active_track_ids, trk_xyxy = self.tracker.get_active_tracks_xyxy()
                 
                 # Match detections to tracks
                 iou_threshold = self.control_state.tracker_iou_threshold
                 matches, unmatched_dets, unmatched_tracks = match_detections_to_tracks(
                     detections,
-                    active_tracks,
+                    active_track_ids,
+                    trk_xyxy,
                     iou_threshold,
                 )
                 
                 matched_track_ids = set(matches.values())
+                updates: list[TrackUpdate] = []
                 
                 # Update matched tracks
                 for det_idx, track_id in matches.items():
@@ -79,9 +88,9 @@ class TrackerModule(BaseModule):
                         event.frame_id,
                         event.timestamp_ms,
                     )
-                    
-                    # Publish track update
-                    await self._publish_track_update(track, event.frame_id, event.timestamp_ms)
+                    updates.append(
+                        self._make_track_update(track, event.frame_id, event.timestamp_ms)
+                    )
                 
                 # Create new tracks for unmatched detections
                 for det_idx in unmatched_dets:
@@ -92,42 +101,56 @@ class TrackerModule(BaseModule):
                         event.frame_id,
                         event.timestamp_ms,
                     )
-                    
-                    # Publish track update
-                    await self._publish_track_update(track, event.frame_id, event.timestamp_ms)
+                    updates.append(
+                        self._make_track_update(track, event.frame_id, event.timestamp_ms)
+                    )
                 
-                # Mark missed tracks
-                self.tracker.mark_missed_tracks(matched_track_ids)
+                if updates:
+                    # Legacy per-track events for row-oriented consumers
+                    await self.result_bus.publish_many(updates)
+                    # One columnar batch for the vectorized consumers
+                    await self.result_bus.publish(
+                        TrackBatch(
+                            frame_id=event.frame_id,
+                            timestamp_ms=event.timestamp_ms,
+                            track_ids=np.array(
+                                [u.track_id for u in updates], dtype=np.int32
+                            ),
+                            labels=[u.label for u in updates],
+                            bboxes=np.array(
+                                [u.bbox for u in updates], dtype=np.float32
+                            ),
+                            stable=np.array(
+                                [u.stable for u in updates], dtype=bool
+                            ),
+                        )
+                    )
                 
-                # Evict old tracks
-                evicted = self.tracker.evict_old_tracks()
+                # Age unmatched tracks and evict stale ones in one pass
+                evicted = self.tracker.step(matched_track_ids)
                 if evicted:
                     logger.debug(f"{self.name}: evicted tracks {evicted}")
                 
                 if event.frame_id % 100 == 0:
                     logger.debug(
                         f"{self.name}: frame {event.frame_id}, "
-                        f"{len(active_tracks)} active tracks"
+                        f"{len(active_track_ids)} active tracks"
                     )
         
         except Exception as e:
             logger.error(f"{self.name} error: {e}", exc_info=True)
     
-    async def _publish_track_update(self, track, frame_id: int, timestamp_ms: int) -> None:
-        """Publish a track update."""
-        velocity = track.compute_velocity()
-        
-        update = TrackUpdate(
+    def _make_track_update(self, track, frame_id: int, timestamp_ms: int) -> TrackUpdate:
+        """Build the per-track event for one updated track."""
+        return TrackUpdate(
             track_id=track.track_id,
             frame_id=frame_id,
             timestamp_ms=timestamp_ms,
             label=track.label,
             bbox=track.bbox,
             stable=track.stable,
-            velocity=velocity,
+            velocity=track.compute_velocity(),
         )
-        
-        await self.result_bus.publish(update)
     
     async def stop(self) -> None:
         """Stop the module."""
@@ -1,9 +1,13 @@
 """Track state management."""
 
-from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
+# Rows kept per track in the history ring buffer
+HISTORY_LEN = 5
+
 
 @dataclass
 class Track:
@@ -13,9 +17,25 @@ class Track:
     label: str
     bbox: tuple[float, float, float, float]
     
-    # History
-    history: deque = field(default_factory=lambda: deque(maxlen=5))
+    # Corner form of bbox, cached so the per-frame matcher never redoes
+    # the x+w / y+h adds (kept in sync by update())
+    bbox_xyxy: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
     
+    # History as a preallocated ring buffer of [x, y, w, h, frame_id,
+    # timestamp_ms] rows - columnar float32 instead of a deque of dicts,
+    # so updates allocate nothing and future smoothing passes can read it
+    # as one contiguous array
+    history: np.ndarray = field(
+        default_factory=lambda: np.zeros((HISTORY_LEN, 6), dtype=np.float32)
+    )
+    _head: int = 0
+    _count: int = 0
+
+    # Last two bbox centers as (cx, cy, timestamp_ms), maintained by
+    # update() so compute_velocity never re-derives them from history
+    _cur_center: Optional[tuple[float, float, int]] = None
+    _last_center: Optional[tuple[float, float, int]] = None
+
     # Stability
     consecutive_hits: int = 0
     frames_since_update: int = 0
@@ -31,12 +51,23 @@ class Track:
     ) -> None:
         """Update track with new detection."""
         self.bbox = bbox
-        self.history.append({
-            "bbox": bbox,
-            "frame_id": frame_id,
-            "timestamp_ms": timestamp_ms,
-        })
-        
+        self.bbox_xyxy = (bbox[0], bbox[1], bbox[0] + bbox[2], bbox[1] + bbox[3])
+        self._last_center = self._cur_center
+        self._cur_center = (
+            bbox[0] + bbox[2] * 0.5,
+            bbox[1] + bbox[3] * 0.5,
+            timestamp_ms,
+        )
+        row = self.history[self._head]
+        row[0] = bbox[0]
+        row[1] = bbox[1]
+        row[2] = bbox[2]
+        row[3] = bbox[3]
+        row[4] = frame_id
+        row[5] = timestamp_ms
+        self._head = (self._head + 1) % HISTORY_LEN
+        self._count = min(self._count + 1, HISTORY_LEN)
+
         self.consecutive_hits += 1
         self.frames_since_update = 0
         
@@ -49,25 +80,25 @@ class Track:
         self.frames_since_update += 1
         self.consecutive_hits = 0
     
+    def history_view(self) -> np.ndarray:
+        """The last _count history rows in chronological order.
+
+        Copies only when the ring has wrapped; hot-path writers never pay
+        for the reordering.
+        """
+        if self._count < HISTORY_LEN:
+            return self.history[: self._count]
+        return np.roll(self.history, -self._head, axis=0)
+
     def compute_velocity(self) -> Optional[tuple[float, float]]:
-        """Compute velocity from history."""
-        if len(self.history) < 2:
+        """Compute velocity from the two most recent centers."""
+        if self._last_center is None:
             return None
-        
-        recent = self.history[-1]
-        prev = self.history[-2]
-        
-        # Use center points
-        rx, ry, rw, rh = recent["bbox"]
-        px, py, pw, ph = prev["bbox"]
-        
-        rcx, rcy = rx + rw/2, ry + rh/2
-        pcx, pcy = px + pw/2, py + ph/2
-        
-        dx = rcx - pcx
-        dy = rcy - pcy
-        
-        return (dx, dy)
+
+        return (
+            self._cur_center[0] - self._last_center[0],
+            self._cur_center[1] - self._last_center[1],
+        )
 
 
 class Tracker:
@@ -77,6 +108,8 @@ class Tracker:
         self.max_age = max_age  # Frames before track eviction
         self.next_track_id = 1
         self.tracks: dict[int, Track] = {}
+        # Reused xyxy staging buffer for the matcher (doubling growth)
+        self._xyxy_buf = np.empty((0, 4), dtype=np.float32)
     
     def get_track(self, track_id: int) -> Optional[Track]:
         """Get track by ID."""
@@ -130,10 +163,47 @@ class Tracker:
         
         return evicted
     
-    def get_active_tracks(self) -> dict[int, tuple[float, float, float, float]]:
-        """Get current bboxes for all active tracks."""
-        return {
-            track_id: track.bbox
-            for track_id, track in self.tracks.items()
-        }
+    def step(self, matched_track_ids: set[int]) -> list[int]:
+        """Per-frame housekeeping: age unmatched tracks, evict stale ones.
+
+        Fuses mark_missed_tracks and evict_old_tracks into a single pass
+        with no snapshot copy - a matched track has just had its miss
+        counter reset by update(), so only unmatched tracks can cross
+        max_age. The separate methods remain for callers needing one side.
+
+        Returns:
+            IDs of the tracks evicted this frame
+        """
+        evicted = []
+        for track_id, track in self.tracks.items():
+            if track_id not in matched_track_ids:
+                track.mark_missed()
+                if track.frames_since_update > self.max_age:
+                    evicted.append(track_id)
+
+        for track_id in evicted:
+            del self.tracks[track_id]
+
+        return evicted
+
+    def get_active_tracks_xyxy(self) -> tuple[list[int], np.ndarray]:
+        """Get all active track ids and their corner boxes for matching.
+        
+        The (M, 4) xyxy array is a view into a buffer reused across
+        frames, filled from each track's cached corner tuple - no dict
+        rebuild, conversion or fresh allocation per frame. Consume it
+        before the next call.
+        """
+        n = len(self.tracks)
+        if self._xyxy_buf.shape[0] < n:
+            capacity = max(n, 2 * self._xyxy_buf.shape[0], 8)
+            self._xyxy_buf = np.empty((capacity, 4), dtype=np.float32)
+        
+        track_ids = []
+        buf = self._xyxy_buf
+        for i, (track_id, track) in enumerate(self.tracks.items()):
+            track_ids.append(track_id)
+            buf[i] = track.bbox_xyxy
+        
+        return track_ids, buf[:n]
 
@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
-import queue
+import re
 import threading
+import time
+from collections import deque
 from typing import Optional, List
 from modules.base import BaseModule
 from contracts.schemas import FusionAnnouncement, SceneDescription
@@ -19,6 +21,23 @@ except ImportError:
     TTS_AVAILABLE = False
     logger.warning("pyttsx3 not installed (pip install pyttsx3)")
 
+# Streaming neural TTS: audio starts playing while later sentences are
+# still being synthesized. Needs a downloaded voice model, so it is only
+# used when the caller passes piper_voice=.
+try:
+    from piper import PiperVoice
+    import sounddevice
+    PIPER_AVAILABLE = True
+except ImportError:
+    PIPER_AVAILABLE = False
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text at sentence boundaries, dropping empty pieces."""
+    return [s for s in _SENTENCE_RE.split(text) if s]
+
 
 class VoiceOutputModule(BaseModule):
     """
@@ -38,73 +57,145 @@ class VoiceOutputModule(BaseModule):
         rate: int = 175,  # Words per minute
         volume: float = 0.9,  # 0.0 to 1.0
         voice_gender: str = "female",  # "male" or "female"
-        interrupt_mode: bool = False  # If True, interrupt current speech for new announcements
+        interrupt_mode: bool = False,  # If True, interrupt current speech for new announcements
+        piper_voice: Optional[str] = None  # Path to a Piper .onnx voice model
     ):
         """
         Initialize voice output module.
-        
+
         Args:
             enabled: Whether voice output is enabled
             rate: Speech rate (words per minute)
             volume: Volume level (0.0 to 1.0)
             voice_gender: Preferred voice gender
             interrupt_mode: If True, new announcements interrupt current speech
+            piper_voice: Piper voice model to stream through (sentence by
+                sentence, audio starts before synthesis finishes); falls
+                back to pyttsx3 when unset or piper is not installed
         """
         self.enabled = enabled
         self.rate = rate
         self.volume = volume
         self.voice_gender = voice_gender
         self.interrupt_mode = interrupt_mode
+        self.piper_voice = piper_voice if PIPER_AVAILABLE else None
         self.running = False
         self.result_bus: Optional[ResultBus] = None
         self.control_state: Optional[ControlState] = None
-        self.is_speaking = False  # Track if TTS is currently speaking
+        # Set while the worker is idle, cleared while it speaks; the
+        # worker flips it through call_soon_threadsafe so coroutines can
+        # await it instead of polling a boolean
+        self._done_speaking: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
-        if not TTS_AVAILABLE:
+        if not TTS_AVAILABLE and self.piper_voice is None:
             self.enabled = False
-            logger.warning("Voice output disabled - pyttsx3 not available")
+            logger.warning("Voice output disabled - no TTS backend available")
         
         if self.enabled:
-            # TTS engine must run in separate thread
-            self.speech_queue = queue.Queue(maxsize=1)  # Only hold 1 item max!
+            # TTS engine must run in separate thread. The channel to it is
+            # a single-slot deque plus a wake event instead of a
+            # Queue(maxsize=1): appends are atomic (no condition-variable
+            # lock per message) and maxlen=1 makes "replace whatever is
+            # pending" a one-line swap
+            self._slot: "deque[str]" = deque(maxlen=1)
+            self._wake = threading.Event()
             self.tts_thread = None
             self._init_tts_engine()
     
     def _init_tts_engine(self) -> None:
         """Initialize TTS engine in background thread."""
         def tts_worker():
-            engine = pyttsx3.init()
-            engine.setProperty('rate', self.rate)
-            engine.setProperty('volume', self.volume)
-            
-            # Set voice
-            voices = engine.getProperty('voices')
-            for voice in voices:
-                if self.voice_gender.lower() in voice.name.lower():
-                    engine.setProperty('voice', voice.id)
-                    break
-            
-            logger.info(f"TTS engine initialized (rate: {self.rate}, volume: {self.volume})")
-            
+            piper = None
+            audio_out = None
+            if self.piper_voice is not None:
+                try:
+                    piper = PiperVoice.load(self.piper_voice)
+                    audio_out = sounddevice.RawOutputStream(
+                        samplerate=piper.config.sample_rate,
+                        channels=1,
+                        dtype="int16",
+                    )
+                    audio_out.start()
+                    logger.info(f"Piper streaming TTS ready ({self.piper_voice})")
+                except Exception as e:
+                    logger.warning(f"Piper init failed, using pyttsx3: {e}")
+                    piper = None
+
+            engine = None
+            if piper is None:
+                engine = pyttsx3.init()
+                engine.setProperty('rate', self.rate)
+                engine.setProperty('volume', self.volume)
+
+                # Set voice
+                voices = engine.getProperty('voices')
+                for voice in voices:
+                    if self.voice_gender.lower() in voice.name.lower():
+                        engine.setProperty('voice', voice.id)
+                        break
+
+                logger.info(f"TTS engine initialized (rate: {self.rate}, volume: {self.volume})")
+
+                # Warm up the driver before the first real announcement:
+                # the initial runAndWait pays audio-device setup and voice
+                # loading that would otherwise land on a live, possibly
+                # urgent message
+                warmup_start = time.monotonic()
+                try:
+                    engine.say(" ")
+                    engine.runAndWait()
+                    logger.info(
+                        "TTS warmup took %.0f ms",
+                        (time.monotonic() - warmup_start) * 1000,
+                    )
+                except Exception as e:
+                    logger.warning(f"TTS warmup failed: {e}")
+
             while self.running:
                 try:
                     # Block until we get something to say (with timeout)
-                    text = self.speech_queue.get(timeout=0.5)
-                    
+                    self._wake.wait(timeout=0.5)
+                    self._wake.clear()
+                    try:
+                        text = self._slot.popleft()
+                    except IndexError:
+                        continue
+
                     if text:
-                        self.is_speaking = True
+                        self._set_speaking(True)
                         logger.info(f"🔊 Speaking: {text}")
-                        engine.say(text)
-                        engine.runAndWait()
-                        self.is_speaking = False
-                        
-                except queue.Empty:
-                    continue
+                        # Sentence-at-a-time either way: streaming piper
+                        # plays the first sentence while the next one
+                        # synthesizes, and even pyttsx3 starts audio after
+                        # one sentence's synthesis instead of the whole
+                        # description's
+                        if piper is not None:
+                            for sentence in _split_sentences(text):
+                                for chunk in piper.synthesize_stream_raw(sentence):
+                                    audio_out.write(chunk)
+                        else:
+                            for sentence in _split_sentences(text):
+                                engine.say(sentence)
+                                engine.runAndWait()
+                        self._set_speaking(False)
+
                 except Exception as e:
                     logger.error(f"TTS error: {e}")
-                    self.is_speaking = False
-        
+                    self._set_speaking(False)
+
+            if audio_out is not None:
+                audio_out.stop()
+                audio_out.close()
+
         self.tts_thread = threading.Thread(target=tts_worker, daemon=True)
+
+    def _set_speaking(self, speaking: bool) -> None:
+        """Flip the speaking event from the worker thread."""
+        target = (
+            self._done_speaking.clear if speaking else self._done_speaking.set
+        )
+        self._loop.call_soon_threadsafe(target)
     
     async def start(
         self,
@@ -121,6 +212,12 @@ class VoiceOutputModule(BaseModule):
             logger.info(f"{self.name} module disabled")
             return []
         
+        # Speaking-state event lives on this loop; create it before the
+        # worker thread can touch it
+        self._loop = asyncio.get_running_loop()
+        self._done_speaking = asyncio.Event()
+        self._done_speaking.set()
+
         # Start TTS thread
         self.tts_thread.start()
         
@@ -143,15 +240,14 @@ class VoiceOutputModule(BaseModule):
                     continue
                 
                 # If currently speaking, skip this announcement (don't interrupt)
-                if self.is_speaking:
+                if not self._done_speaking.is_set():
                     continue
                 
-                # Try to add to queue (will fail if full, which is what we want)
-                try:
-                    self.speech_queue.put_nowait(announcement.text)
-                except queue.Full:
-                    # Queue is full (already has 1 item), skip this announcement
-                    pass
+                # Announcements never displace a pending item (that slot
+                # may hold a higher-priority description)
+                if not self._slot:
+                    self._slot.append(announcement.text)
+                    self._wake.set()
         
         except Exception as e:
             logger.error(f"{self.name} announcement error: {e}", exc_info=True)
@@ -166,23 +262,15 @@ class VoiceOutputModule(BaseModule):
                 if self.control_state.paused:
                     continue
                 
-                # Scene descriptions have higher priority - always try to speak them
-                # But wait if currently speaking
-                while self.is_speaking and self.running:
-                    await asyncio.sleep(0.1)
+                # Scene descriptions have higher priority - always try to
+                # speak them, waking exactly when the worker goes idle
+                # instead of polling on a 100 ms grain
+                await self._done_speaking.wait()
                 
-                # Clear the queue and add this description
-                try:
-                    while not self.speech_queue.empty():
-                        self.speech_queue.get_nowait()
-                except queue.Empty:
-                    pass
-                
-                # Queue for speech
-                try:
-                    self.speech_queue.put_nowait(description.description)
-                except queue.Full:
-                    pass  # Shouldn't happen since we just cleared it
+                # maxlen=1 drops whatever was pending - the "clear then
+                # put" dance is a single atomic swap
+                self._slot.append(description.description)
+                self._wake.set()
         
         except Exception as e:
             logger.error(f"{self.name} description error: {e}", exc_info=True)
@@ -190,7 +278,11 @@ class VoiceOutputModule(BaseModule):
     async def stop(self) -> None:
         """Stop the module."""
         self.running = False
+        if self._done_speaking is not None:
+            # Release any coroutine still waiting on the worker
+            self._done_speaking.set()
         if self.enabled and hasattr(self, 'tts_thread') and self.tts_thread:
+            self._wake.set()  # wake the worker so it sees running=False
             self.tts_thread.join(timeout=2)
         logger.info(f"{self.name} module stopped")
 
@@ -14,6 +14,15 @@ from modules.fusion.module import FusionModule
 from modules.scene_description.module import SceneDescriptionModule  # NEW!
 from contracts.schemas import FusionAnnouncement, NavigationGuidance, SceneDescription  # NEW!
 
+# Swap in the libuv event loop when available: the loop is on the
+# critical path of every frame publish, and uvloop's call_soon/IO
+# overhead is a fraction of the default selector loop's
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -71,28 +80,32 @@ async def main():
     logger.info("ANNOUNCEMENTS:")
     logger.info("=" * 60)
     
-    # Subscribe to announcements and navigation guidance
-    async def print_events():
-        """Print navigation guidance and announcements."""
-        async for event in result_bus.subscribe_all():
-            if isinstance(event, FusionAnnouncement):
-                logger.info(f"📢 {event.text.upper()} [{event.kind}]")
-            elif isinstance(event, SceneDescription):  # NEW!
-                logger.info(f"🖼️  SCENE: {event.description}")
-            elif isinstance(event, NavigationGuidance):
-                urgency_emoji = {
-                    "low": "ℹ️",
-                    "medium": "⚠️",
-                    "high": "⚠️⚠️",
-                    "critical": "🚨",
-                }
-                emoji = urgency_emoji.get(event.urgency, "•")
-                logger.info(
-                    f"{emoji} Track #{event.track_id}: {event.guidance_text} "
-                    f"[{event.direction}, {event.zone}, {event.movement}]"
-                )
-    
-    tasks.append(asyncio.create_task(print_events()))
+    # Log events through sync callbacks instead of a subscribe_all()
+    # consumer - no extra per-subscriber queue, and event types we don't
+    # log cost nothing
+    urgency_emoji = {
+        "low": "ℹ️",
+        "medium": "⚠️",
+        "high": "⚠️⚠️",
+        "critical": "🚨",
+    }
+
+    def print_guidance(event):
+        emoji = urgency_emoji.get(event.urgency, "•")
+        logger.info(
+            f"{emoji} Track #{event.track_id}: {event.guidance_text} "
+            f"[{event.direction}, {event.zone}, {event.movement}]"
+        )
+
+    result_bus.on(
+        FusionAnnouncement,
+        lambda event: logger.info(f"📢 {event.text.upper()} [{event.kind}]"),
+    )
+    result_bus.on(
+        SceneDescription,
+        lambda event: logger.info(f"🖼️  SCENE: {event.description}"),
+    )
+    result_bus.on(NavigationGuidance, print_guidance)
     
     try:
         # Wait for all tasks
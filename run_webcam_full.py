@@ -16,6 +16,15 @@ from modules.voice_input.module import VoiceInputModule
 from modules.voice_output.module import VoiceOutputModule
 from contracts.schemas import FusionAnnouncement, SceneDescription
 
+# Swap in the libuv event loop when available: the loop is on the
+# critical path of every frame publish, and uvloop's call_soon/IO
+# overhead is a fraction of the default selector loop's
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -76,6 +85,15 @@ async def main():
         VoiceOutputModule(enabled=True, rate=175),  # NEW!
     ]
     
+    # Overlap the blocking warm-ups: camera open/format negotiation and
+    # microphone ambient-noise calibration each cost hundreds of ms of
+    # GIL-releasing C work, so running them concurrently shaves about a
+    # second off startup
+    await asyncio.gather(
+        camera_source.open(),
+        *(m.warmup() for m in modules if hasattr(m, "warmup")),
+    )
+
     # Start all
     tasks = []
     tasks.append(asyncio.create_task(camera_source.run()))
@@ -90,16 +108,17 @@ async def main():
     logger.info("LIVE OUTPUT:")
     logger.info("=" * 70)
     
-    # Log events for visibility
-    async def log_events():
-        """Log announcements and descriptions."""
-        async for event in result_bus.subscribe_all():
-            if isinstance(event, FusionAnnouncement):
-                logger.info(f"📢 ANNOUNCEMENT: {event.text}")
-            elif isinstance(event, SceneDescription):
-                logger.info(f"🖼️  SCENE: {event.description}")
-    
-    tasks.append(asyncio.create_task(log_events()))
+    # Log events for visibility via sync callbacks - unlike a
+    # subscribe_all() consumer this adds no per-subscriber queue and no
+    # fan-out cost for the event types we don't log
+    result_bus.on(
+        FusionAnnouncement,
+        lambda event: logger.info(f"📢 ANNOUNCEMENT: {event.text}"),
+    )
+    result_bus.on(
+        SceneDescription,
+        lambda event: logger.info(f"🖼️  SCENE: {event.description}"),
+    )
     
     try:
         # Wait for all tasks
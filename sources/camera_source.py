@@ -2,8 +2,11 @@
 
 import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import cv2
+import numpy as np
 from contracts.schemas import FramePacket
 from core_platform.frame_bus import FrameBus
 from core_platform.clock import Clock
@@ -38,75 +41,137 @@ class CameraSource:
         self.running = False
         self.current_frame_id = 0
         self.clock: Optional[Clock] = None
-    
-    async def run(self) -> None:
-        """Main loop - read and publish frames from webcam."""
-        self.running = True
-        
-        # Open camera
+        self._cap: Optional[cv2.VideoCapture] = None
+
+        # V4L2 opens and reads block for up to a frame interval; keep
+        # them off the event loop (single worker - the camera is one
+        # device)
+        self._capture_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="camera-read"
+        )
+
+    def _open_blocking(self) -> Optional[cv2.VideoCapture]:
+        """Open and configure the device (blocking, runs in the pool)."""
         cap = cv2.VideoCapture(self.camera_id)
-        
         if not cap.isOpened():
-            logger.error(f"Failed to open camera {self.camera_id}")
-            return
-        
+            return None
+
+        # Ask the camera for MJPEG: UVC webcams compress on-device, so the
+        # USB link carries JPEG instead of raw YUYV (which caps most
+        # cameras well below their rated fps at this resolution). Cameras
+        # that don't support it silently keep their native format.
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+
         # Set resolution
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
         cap.set(cv2.CAP_PROP_FPS, self.fps)
-        
+        return cap
+
+    async def open(self) -> None:
+        """Open the camera ahead of run().
+
+        Device open plus format negotiation takes 200-500 ms; runners
+        call this inside an asyncio.gather so it overlaps other modules'
+        warm-up work instead of adding to startup serially. run() opens
+        on demand if this was never called.
+        """
+        if self._cap is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self._cap = await loop.run_in_executor(
+            self._capture_pool, self._open_blocking
+        )
+
+    async def run(self) -> None:
+        """Main loop - read and publish frames from webcam."""
+        self.running = True
+
+        await self.open()
+        cap = self._cap
+        if cap is None:
+            logger.error(f"Failed to open camera {self.camera_id}")
+            return
+
         # Get actual resolution
         actual_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         actual_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        
+
         self.clock = Clock(fps=self.fps)
-        
+
         logger.info(
             f"Opened camera {self.camera_id} "
             f"({actual_width}x{actual_height} @ {self.fps} fps)"
         )
-        
+
+        capture_pool = self._capture_pool
+        loop = asyncio.get_running_loop()
+
+        # Preallocated capture ring: cap.read(buf) decodes into an
+        # existing array instead of allocating ~900 KB per frame (13 MB/s
+        # of churn at 15 fps). A single buffer would be overwritten while
+        # consumers still hold the previous packet's pixels, so rotate
+        # through a few - the frame bus is latest-wins and detection
+        # finishes well inside the ring's reuse horizon.
+        ring = [
+            np.empty((actual_height, actual_width, 3), dtype=np.uint8)
+            for _ in range(4)
+        ]
+        buf_idx = 0
+
         try:
+            # Absolute-deadline pacing: each iteration advances the
+            # deadline by exactly one frame interval and sleeps only the
+            # remainder, so read time doesn't stack on top of the sleep
+            # (which halved the effective rate) and no drift accumulates
+            next_deadline = time.monotonic()
+
             while self.running:
-                # Handle pause
+                # Handle pause (event-driven: resume wakes the loop
+                # immediately instead of after a poll interval)
                 if self.control_state.paused:
-                    await asyncio.sleep(0.1)
+                    await self.control_state.wait_resumed()
+                    next_deadline = time.monotonic()
                     continue
-                
-                # Read frame
-                ret, frame = cap.read()
+
+                # Read frame into the next ring slot (OpenCV reallocates
+                # only if the camera's format differs from the buffer)
+                ret, frame = await loop.run_in_executor(
+                    capture_pool, cap.read, ring[buf_idx]
+                )
                 if not ret:
                     logger.warning(f"Failed to read frame {self.current_frame_id}")
-                    await asyncio.sleep(0.1)
                     continue
-                
-                # Encode as JPEG
-                _, jpg_buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                jpg_bytes = jpg_buffer.tobytes()
-                
-                # Create packet
+                buf_idx = (buf_idx + 1) % len(ring)
+
+                # Publish the raw pixels; JPEG is encoded lazily by the
+                # packet only if a consumer (the UI stream) asks for it,
+                # so the per-frame imencode disappears from this loop
                 height, width = frame.shape[:2]
                 packet = FramePacket(
                     frame_id=self.current_frame_id,
                     timestamp_ms=self.clock.frame_to_timestamp(self.current_frame_id),
                     width=width,
                     height=height,
-                    jpg_bytes=jpg_bytes,
+                    bgr=frame,
                 )
                 
                 # Publish
                 await self.frame_bus.publish(packet)
                 
                 self.current_frame_id += 1
-                
-                # Delay based on FPS (ignore speed control for real-time camera)
-                delay = 1.0 / self.fps
-                await asyncio.sleep(delay)
-        
+
+                # Pace to the configured FPS (ignore speed control for
+                # real-time camera)
+                next_deadline += 1.0 / self.fps
+                await asyncio.sleep(max(0.0, next_deadline - time.monotonic()))
+
         except Exception as e:
             logger.error(f"Camera error: {e}", exc_info=True)
         finally:
+            capture_pool.shutdown(wait=False)
             cap.release()
+            self._cap = None
             logger.info(f"Released camera {self.camera_id}")
     
     async def stop(self) -> None:
@@ -2,12 +2,73 @@
 
 import json
 import logging
+import os
+import shutil
+import subprocess
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import cv2
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Label text -> (boolean glyph mask, text height). Rasterizing glyphs is
+# the most expensive draw call per actor; caching the mask turns per-frame
+# putText into a slice assignment.
+_label_sprites: dict = {}
+
+
+def _label_sprite(label: str) -> tuple:
+    """Rasterize a label once and cache its glyph mask."""
+    sprite = _label_sprites.get(label)
+    if sprite is None:
+        (tw, th), baseline = cv2.getTextSize(
+            label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1
+        )
+        tile = np.zeros((th + baseline, tw, 3), dtype=np.uint8)
+        cv2.putText(
+            tile, label, (0, th),
+            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1
+        )
+        sprite = (tile.any(axis=2), th)
+        _label_sprites[label] = sprite
+    return sprite
+
+
+def _blit_label(frame: np.ndarray, label: str, x: int, y: int) -> None:
+    """Stamp a cached label sprite with its text baseline at (x, y)."""
+    mask, th = _label_sprite(label)
+    h, w = mask.shape
+    top, left = y - th, x
+    t0, l0 = max(top, 0), max(left, 0)
+    b0 = min(top + h, frame.shape[0])
+    r0 = min(left + w, frame.shape[1])
+    if t0 >= b0 or l0 >= r0:
+        return
+    region = frame[t0:b0, l0:r0]
+    region[mask[t0 - top:b0 - top, l0 - left:r0 - left]] = 255
+
+
+def _draw_actor(
+    frame: np.ndarray, shape: str, color: tuple, label: str,
+    x: int, y: int, size,
+) -> None:
+    """Draw one actor (filled shape, border, label) at an integer position."""
+    if shape == "rect":
+        pt1 = (x, y)
+        pt2 = (x + size[0], y + size[1])
+        cv2.rectangle(frame, pt1, pt2, color, -1)
+        # Add border
+        cv2.rectangle(frame, pt1, pt2, (255, 255, 255), 2)
+    elif shape == "circle":
+        cv2.circle(frame, (x, y), size, color, -1)
+        cv2.circle(frame, (x, y), size, (255, 255, 255), 2)
+
+    # Add label text
+    _blit_label(frame, label, x, y - 10)
+
 
 def generate_sample_data(
     output_dir: Path,
@@ -21,7 +82,8 @@ def generate_sample_data(
     
     Creates:
     - output_dir/sample.mp4
-    - output_dir/sample_frames/ with individual JPEGs and metadata.json
+    - output_dir/sample_frames/ with frames.zip (uncompressed JPEG
+      archive) and metadata.json
     
     Returns:
         (mp4_path, frames_dir_path)
@@ -75,69 +137,144 @@ def generate_sample_data(
         },
     ]
     
-    # Create video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    video_writer = cv2.VideoWriter(str(mp4_path), fourcc, fps, (width, height))
-    
+    # Create video writer. When ffmpeg is on PATH, pipe raw BGR straight
+    # into libx264: one contiguous stdin stream instead of a per-frame
+    # VideoWriter call, with much better compression than mp4v. Falls
+    # back to cv2.VideoWriter where the binary is absent.
+    encoder_proc = None
+    video_writer = None
+    if shutil.which("ffmpeg"):
+        encoder_proc = subprocess.Popen(
+            [
+                "ffmpeg", "-y",
+                "-f", "rawvideo", "-pix_fmt", "bgr24",
+                "-s", f"{width}x{height}", "-r", str(fps),
+                "-i", "-",
+                "-c:v", "libx264", "-preset", "ultrafast",
+                "-pix_fmt", "yuv420p",
+                str(mp4_path),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        video_writer = cv2.VideoWriter(str(mp4_path), fourcc, fps, (width, height))
+
     logger.info(f"Generating {total_frames} frames...")
-    
-    for frame_idx in range(total_frames):
-        # Create gray background
-        frame = np.full((height, width, 3), 128, dtype=np.uint8)
-        
-        for actor in actors:
-            # Check if actor is active in this frame
-            frame_range = actor["frames"].split("-")
-            start_frame = int(frame_range[0])
-            end_frame = int(frame_range[1])
-            
-            if not (start_frame <= frame_idx <= end_frame):
-                continue
-            
-            # Calculate position with wrapping
-            elapsed = frame_idx - start_frame
-            x = (actor["start_pos"][0] + actor["velocity"][0] * elapsed) % width
-            y = (actor["start_pos"][1] + actor["velocity"][1] * elapsed) % height
-            
-            # For obstacle, simulate approaching by growing size
-            if actor["label"] == "obstacle" and actor["shape"] == "circle":
-                growth_factor = 1.0 + (elapsed / 200.0) * 1.5
-                size = int(actor["size"][0] * growth_factor)
-            else:
-                size = actor["size"]
-            
-            # Draw shape
-            if actor["shape"] == "rect":
-                pt1 = (int(x), int(y))
-                pt2 = (int(x + size[0]), int(y + size[1]))
-                cv2.rectangle(frame, pt1, pt2, actor["color"], -1)
-                # Add border
-                cv2.rectangle(frame, pt1, pt2, (255, 255, 255), 2)
-            elif actor["shape"] == "circle":
-                center = (int(x), int(y))
-                cv2.circle(frame, center, size, actor["color"], -1)
-                cv2.circle(frame, center, size, (255, 255, 255), 2)
-            
-            # Add label text
-            text_pos = (int(x), int(y) - 10)
-            cv2.putText(
-                frame, 
-                actor["label"], 
-                text_pos, 
-                cv2.FONT_HERSHEY_SIMPLEX, 
-                0.5, 
-                (255, 255, 255), 
-                1
+
+    # Stationary actors render identically every frame: bake them into a
+    # background drawn once, so each frame starts as a single memcpy
+    # instead of np.full plus redundant draw calls
+    base_frame = np.full((height, width, 3), 128, dtype=np.uint8)
+
+    # For the rest, precompute the whole trajectory with broadcast
+    # arithmetic - two NumPy expressions replace per-frame position math
+    moving = []
+    for actor in actors:
+        start_frame, end_frame = (int(p) for p in actor["frames"].split("-"))
+
+        if actor["velocity"] == (0, 0):
+            x, y = actor["start_pos"]
+            _draw_actor(
+                base_frame, actor["shape"], actor["color"], actor["label"],
+                x, y, actor["size"],
             )
-        
-        # Write to video
-        video_writer.write(frame)
-        
-        # Save as individual JPEG
-        frame_filename = frames_dir / f"frame_{frame_idx:04d}.jpg"
-        cv2.imwrite(str(frame_filename), frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-    
-    video_writer.release()
+            continue
+
+        elapsed = np.arange(end_frame - start_frame + 1, dtype=np.float64)
+        xs = (
+            (actor["start_pos"][0] + actor["velocity"][0] * elapsed) % width
+        ).astype(np.int32)
+        ys = (
+            (actor["start_pos"][1] + actor["velocity"][1] * elapsed) % height
+        ).astype(np.int32)
+
+        # For obstacle, simulate approaching by growing size
+        if actor["label"] == "obstacle" and actor["shape"] == "circle":
+            sizes = (
+                actor["size"][0] * (1.0 + (elapsed / 200.0) * 1.5)
+            ).astype(np.int32)
+        else:
+            sizes = None
+
+        # Unpack the dict fields once - the render loop indexes plain
+        # tuples and arrays, never a dict
+        moving.append((
+            actor["shape"], actor["color"], actor["label"], actor["size"],
+            start_frame, end_frame, xs, ys, sizes,
+        ))
+
+    # JPEG encode+write per frame is embarrassingly parallel, and cv2
+    # releases the GIL for the encode - a thread pool overlaps it with
+    # rendering. (Processes would pickle 900 KB of pixels per frame for
+    # no gain.) Each frame is a fresh copy, so handing it to the pool is
+    # safe; in-flight futures are bounded to cap memory.
+    workers = os.cpu_count() or 2
+
+    # Reusable render buffers: np.copyto into a ring instead of
+    # allocating ~900 KB per frame. Encoded frames can still be in
+    # flight on the pool, so the ring carries two slots of slack beyond
+    # the bounded pending window - a slot is never rewritten before its
+    # encode has been drained.
+    buf_ring = [np.empty_like(base_frame) for _ in range(2 * workers + 2)]
+
+    # All frame JPEGs land in one uncompressed archive (they are already
+    # compressed): a single open file instead of an open/write/close
+    # syscall round per frame, and far less inode pressure
+    archive_path = frames_dir / "frames.zip"
+
+    with ThreadPoolExecutor(max_workers=workers) as encoder_pool, \
+            zipfile.ZipFile(archive_path, "w", zipfile.ZIP_STORED) as zf:
+        pending: deque = deque()
+
+        def _drain_one() -> None:
+            idx, fut = pending.popleft()
+            _, buf = fut.result()
+            # ZipFile writes are not thread-safe; the cheap append stays
+            # on this thread while the pool does the encodes
+            zf.writestr(f"frame_{idx:04d}.jpg", buf.tobytes())
+
+        for frame_idx in range(total_frames):
+            frame = buf_ring[frame_idx % len(buf_ring)]
+            np.copyto(frame, base_frame)
+
+            for shape, color, label, base_size, start_frame, end_frame, xs, ys, sizes in moving:
+                if not (start_frame <= frame_idx <= end_frame):
+                    continue
+
+                elapsed = frame_idx - start_frame
+                size = int(sizes[elapsed]) if sizes is not None else base_size
+                _draw_actor(
+                    frame, shape, color, label,
+                    int(xs[elapsed]), int(ys[elapsed]), size,
+                )
+
+            # Write to video (neither encoder is thread-safe, so this
+            # stays on the main thread). The frame is a C-contiguous
+            # uint8 array, so ffmpeg's stdin takes it without a copy.
+            if encoder_proc is not None:
+                encoder_proc.stdin.write(frame)
+            else:
+                video_writer.write(frame)
+
+            # Encode on the pool, append to the archive here
+            pending.append((frame_idx, encoder_pool.submit(
+                cv2.imencode, ".jpg", frame,
+                [cv2.IMWRITE_JPEG_QUALITY, 85],
+            )))
+            while len(pending) > 2 * workers:
+                _drain_one()
+
+        while pending:
+            _drain_one()
+
+    if encoder_proc is not None:
+        encoder_proc.stdin.close()
+        encoder_proc.wait()
+    else:
+        video_writer.release()
     
     # Write metadata for frame directory
     metadata = {
@@ -3,9 +3,12 @@
 import asyncio
 import json
 import logging
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import cv2
+import numpy as np
 from contracts.schemas import FramePacket
 from core_platform.frame_bus import FrameBus
 from core_platform.clock import Clock
@@ -26,10 +29,14 @@ class VideoSource:
         source: Path,
         frame_bus: FrameBus,
         control_state: ControlState,
+        diff_threshold: float = 2.0,
     ):
         self.source = Path(source)
         self.frame_bus = frame_bus
         self.control_state = control_state
+        # Mean absolute difference (on a 32x32 gray thumbnail, 0..255 scale)
+        # below which a frame is tagged as redundant for detection. 0 disables.
+        self.diff_threshold = diff_threshold
         
         # Determine source type
         if self.source.suffix == ".mp4":
@@ -44,6 +51,33 @@ class VideoSource:
         self.total_frames = 0
         self.fps = 30
         self.clock: Optional[Clock] = None
+        self._prev_thumbnail: Optional[np.ndarray] = None
+        self._redundant_count = 0
+
+    def _is_redundant(self, frame: np.ndarray) -> bool:
+        """Cheap frame differencing - True if visually unchanged.
+
+        Compares a 32x32 grayscale thumbnail against the previous frame's so
+        static stretches of footage skip the detection stack entirely.
+        """
+        if self.diff_threshold <= 0:
+            return False
+
+        thumbnail = cv2.cvtColor(
+            cv2.resize(frame, (32, 32), interpolation=cv2.INTER_AREA),
+            cv2.COLOR_BGR2GRAY,
+        ).astype(np.int16)
+
+        prev = self._prev_thumbnail
+        self._prev_thumbnail = thumbnail
+
+        if prev is None:
+            return False
+
+        redundant = bool(np.abs(thumbnail - prev).mean() < self.diff_threshold)
+        if redundant:
+            self._redundant_count += 1
+        return redundant
     
     async def run(self) -> None:
         """Main loop - read and publish frames."""
@@ -64,6 +98,11 @@ class VideoSource:
             logger.error(f"Failed to open video: {self.source}")
             return
         
+        # Two FFmpeg decoder threads is the sweet spot for H.264
+        n_threads_prop = getattr(cv2, "CAP_PROP_N_THREADS", None)
+        if n_threads_prop is not None:
+            cap.set(n_threads_prop, 2)
+        
         self.total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         self.fps = int(cap.get(cv2.CAP_PROP_FPS)) or 30
         self.clock = Clock(fps=self.fps)
@@ -73,53 +112,99 @@ class VideoSource:
             f"({self.total_frames} frames @ {self.fps} fps)"
         )
         
+        loop = asyncio.get_running_loop()
+        decode_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="video-decode")
+        read_future = None
+
         try:
+            # One-frame prefetch: the next decode runs in the pool while
+            # this coroutine publishes and sleeps out the frame interval,
+            # so decode time overlaps pacing instead of adding to it.
+            # Decode already lives off the event loop (run_in_executor);
+            # this closes the remaining serialization.
+            read_future = loop.run_in_executor(decode_pool, cap.read)
+
+            # Absolute-deadline pacing (same as the camera source): each
+            # frame advances the deadline by one speed-scaled interval and
+            # sleeps only the remainder, so decode/publish time doesn't
+            # stack onto the sleep and no drift accumulates
+            period = 1.0 / self.fps
+            deadline = loop.time()
+            # Bound method hoisted out of the loop - one attribute chain
+            # less per frame
+            frame_to_timestamp = self.clock.frame_to_timestamp
+
             while self.running and self.current_frame_id < self.total_frames:
-                # Handle pause
+                # Handle pause (the prefetched frame simply waits);
+                # event-driven, so resume takes effect on the next tick
+                # instead of after a poll interval
                 if self.control_state.paused:
-                    await asyncio.sleep(0.1)
+                    await self.control_state.wait_resumed()
+                    deadline = loop.time()
                     continue
-                
+
                 # Handle seek
                 if self.control_state.pending_seek is not None:
                     seek_frame = self.control_state.pending_seek
-                    self.control_state.pending_seek = None
+                    self.control_state.update(pending_seek=None)
+                    # Drain the stale prefetch before repositioning - the
+                    # capture must not be read and seeked concurrently
+                    await read_future
                     cap.set(cv2.CAP_PROP_POS_FRAMES, seek_frame)
                     self.current_frame_id = seek_frame
+                    read_future = loop.run_in_executor(decode_pool, cap.read)
                     logger.info(f"Seeked to frame {seek_frame}")
                     continue
-                
-                # Read frame
-                ret, frame = cap.read()
+
+                ret, frame = await read_future
                 if not ret:
+                    read_future = None
                     logger.warning(f"Failed to read frame {self.current_frame_id}")
                     break
-                
-                # Encode as JPEG
-                _, jpg_buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                jpg_bytes = jpg_buffer.tobytes()
-                
-                # Create packet
+
+                # Kick off the next decode before doing anything with
+                # this frame
+                read_future = loop.run_in_executor(decode_pool, cap.read)
+
+                # Publish the decoded pixels as-is; the packet encodes to
+                # JPEG lazily if a consumer (the UI stream) asks for it
                 height, width = frame.shape[:2]
                 packet = FramePacket(
                     frame_id=self.current_frame_id,
-                    timestamp_ms=self.clock.frame_to_timestamp(self.current_frame_id),
+                    timestamp_ms=frame_to_timestamp(self.current_frame_id),
                     width=width,
                     height=height,
-                    jpg_bytes=jpg_bytes,
+                    skip_detection=self._is_redundant(frame),
+                    bgr=frame,
                 )
                 
                 # Publish
                 await self.frame_bus.publish(packet)
                 
                 self.current_frame_id += 1
-                
-                # Delay based on speed
-                delay = self.clock.get_frame_delay(self.control_state.speed)
-                await asyncio.sleep(delay)
-        
+
+                deadline += period / max(self.control_state.speed, 1e-6)
+                sleep_for = deadline - loop.time()
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
+                else:
+                    # Overrun: resync instead of bursting to catch up
+                    deadline = loop.time()
+
         finally:
+            # Let any in-flight read finish before releasing the capture
+            if read_future is not None:
+                try:
+                    await read_future
+                except Exception:
+                    pass
+            decode_pool.shutdown(wait=False)
             cap.release()
+            if self._redundant_count:
+                logger.info(
+                    f"VideoSource: {self._redundant_count} redundant frames "
+                    f"tagged for detection skip"
+                )
     
     async def _run_frames(self) -> None:
         """Read from frame directory."""
@@ -140,52 +225,110 @@ class VideoSource:
             f"Opened frame directory: {self.source} "
             f"({self.total_frames} frames @ {self.fps} fps)"
         )
-        
+
+        # All names up front - no per-iteration f-string formatting
+        names = tuple(
+            f"frame_{i:04d}.jpg" for i in range(self.total_frames)
+        )
+
+        # Newer sample sets pack the JPEGs into one uncompressed archive
+        # (one open file instead of an open/read/close round per frame);
+        # older per-file layouts are read as before
+        archive_path = self.source / "frames.zip"
+        archive = (
+            zipfile.ZipFile(archive_path) if archive_path.exists() else None
+        )
+
+        def _read(i: int) -> Optional[bytes]:
+            if archive is not None:
+                try:
+                    return archive.read(names[i])
+                except KeyError:
+                    return None
+            path = self.source / names[i]
+            return path.read_bytes() if path.exists() else None
+
+        loop = asyncio.get_running_loop()
+        read_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="frames-read")
+
         try:
+            # Same one-read-ahead discipline as the mp4 path: the next
+            # file read runs in the pool while this coroutine publishes
+            # and sleeps, so disk latency overlaps pacing and the event
+            # loop never blocks on open()/read()
+            prefetch_id = self.current_frame_id
+            read_future = loop.run_in_executor(read_pool, _read, prefetch_id)
+
+            # Absolute-deadline pacing, as in _run_mp4
+            period = 1.0 / self.fps
+            deadline = loop.time()
+            frame_to_timestamp = self.clock.frame_to_timestamp
+
             while self.running and self.current_frame_id < self.total_frames:
-                # Handle pause
+                # Handle pause (event-driven, as in _run_mp4)
                 if self.control_state.paused:
-                    await asyncio.sleep(0.1)
+                    await self.control_state.wait_resumed()
+                    deadline = loop.time()
                     continue
-                
+
                 # Handle seek
                 if self.control_state.pending_seek is not None:
                     self.current_frame_id = self.control_state.pending_seek
-                    self.control_state.pending_seek = None
+                    self.control_state.update(pending_seek=None)
                     logger.info(f"Seeked to frame {self.current_frame_id}")
                     continue
-                
-                # Read JPEG file
-                frame_path = self.source / f"frame_{self.current_frame_id:04d}.jpg"
-                
-                if not frame_path.exists():
-                    logger.warning(f"Frame file not found: {frame_path}")
+
+                # Reads are addressed by frame id, so a seek just makes
+                # the in-flight prefetch stale - drain it and reissue
+                if prefetch_id != self.current_frame_id:
+                    if read_future is not None:
+                        await read_future
+                    prefetch_id = self.current_frame_id
+                    read_future = loop.run_in_executor(read_pool, _read, prefetch_id)
+
+                jpg_bytes = await read_future
+                if jpg_bytes is None:
+                    logger.warning(
+                        f"Frame not found: {self.source / names[self.current_frame_id]}"
+                    )
                     break
-                
-                with open(frame_path, 'rb') as f:
-                    jpg_bytes = f.read()
-                
+
+                # Prefetch the next frame before publishing this one
+                if self.current_frame_id + 1 < self.total_frames:
+                    prefetch_id = self.current_frame_id + 1
+                    read_future = loop.run_in_executor(read_pool, _read, prefetch_id)
+                else:
+                    read_future = None
+
                 # Create packet
                 packet = FramePacket(
                     frame_id=self.current_frame_id,
-                    timestamp_ms=self.clock.frame_to_timestamp(self.current_frame_id),
+                    timestamp_ms=frame_to_timestamp(self.current_frame_id),
                     width=metadata["width"],
                     height=metadata["height"],
-                    jpg_bytes=jpg_bytes,
+                    jpg=jpg_bytes,
                 )
                 
                 # Publish
                 await self.frame_bus.publish(packet)
                 
                 self.current_frame_id += 1
-                
-                # Delay based on speed
-                delay = self.clock.get_frame_delay(self.control_state.speed)
-                await asyncio.sleep(delay)
-        
+
+                deadline += period / max(self.control_state.speed, 1e-6)
+                sleep_for = deadline - loop.time()
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
+                else:
+                    deadline = loop.time()
+
         except Exception as e:
             logger.error(f"Error reading frames: {e}")
-    
+        finally:
+            # Wait for any in-flight read before closing the archive
+            read_pool.shutdown(wait=True)
+            if archive is not None:
+                archive.close()
+
     async def stop(self) -> None:
         """Stop the video source."""
         self.running = False
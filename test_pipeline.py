@@ -15,6 +15,15 @@ from modules.tracker.module import TrackerModule
 from modules.navigation.module import NavigationModule
 from modules.fusion.module import FusionModule
 
+# Swap in the libuv event loop when available: the loop is on the
+# critical path of every frame publish, and uvloop's call_soon/IO
+# overhead is a fraction of the default selector loop's
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -14,31 +14,35 @@ async def test_frame_bus_publish_subscribe():
     
     # Create a subscriber
     frames_received = []
-    
+    received = asyncio.Event()
+
     async def subscriber():
         async for frame in bus.subscribe():
             frames_received.append(frame)
+            received.set()
             if len(frames_received) >= 3:
                 break
-    
+
     # Start subscriber
     sub_task = asyncio.create_task(subscriber())
-    
-    # Give subscriber time to start
-    await asyncio.sleep(0.01)
-    
-    # Publish frames
+
+    # Wait for the subscriber to register - deterministic, no timed sleep
+    while not bus.subscribers:
+        await asyncio.sleep(0)
+
+    # Publish frames, waiting for each delivery instead of sleeping
     for i in range(3):
         frame = FramePacket(
             frame_id=i,
             timestamp_ms=i * 33,
             width=640,
             height=480,
-            jpg_bytes=b"fake",
+            jpg=b"fake",
         )
         await bus.publish(frame)
-        await asyncio.sleep(0.01)
-    
+        await received.wait()
+        received.clear()
+
     # Wait for subscriber
     await sub_task
     
@@ -72,7 +76,7 @@ async def test_frame_bus_drop_old_frames():
             timestamp_ms=i * 33,
             width=640,
             height=480,
-            jpg_bytes=b"fake",
+            jpg=b"fake",
         )
         await bus.publish(frame)
         await asyncio.sleep(0.01)
@@ -92,18 +96,21 @@ async def test_result_bus_publish_subscribe():
     bus = ResultBus(queue_size=100)
     
     events_received = []
-    
+    received = asyncio.Event()
+
     async def subscriber():
         async for event in bus.subscribe_all():
             events_received.append(event)
+            received.set()
             if len(events_received) >= 3:
                 break
-    
+
     # Start subscriber
     sub_task = asyncio.create_task(subscriber())
-    await asyncio.sleep(0.01)
-    
-    # Publish events
+    while not bus.has_subscribers(DetectionResult):
+        await asyncio.sleep(0)
+
+    # Publish events, waiting for each delivery instead of sleeping
     for i in range(3):
         result = DetectionResult(
             frame_id=i,
@@ -111,8 +118,9 @@ async def test_result_bus_publish_subscribe():
             objects=[],
         )
         await bus.publish(result)
-        await asyncio.sleep(0.01)
-    
+        await received.wait()
+        received.clear()
+
     # Wait for subscriber
     await sub_task
     
@@ -135,8 +143,9 @@ async def test_result_bus_type_filter():
     
     # Start subscriber
     sub_task = asyncio.create_task(subscriber())
-    await asyncio.sleep(0.01)
-    
+    while not bus.has_subscribers(DetectionResult):
+        await asyncio.sleep(0)
+
     # Publish mixed events
     await bus.publish(DetectionResult(frame_id=0, timestamp_ms=0, objects=[]))
     await bus.publish(DetectionResult(frame_id=1, timestamp_ms=33, objects=[]))
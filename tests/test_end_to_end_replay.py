@@ -73,7 +73,7 @@ async def test_full_pipeline():
             timestamp_ms=i * 33,
             width=640,
             height=480,
-            jpg_bytes=b"fake_jpeg_data",
+            jpg=b"fake_jpeg_data",
         )
         await frame_bus.publish(frame)
         await asyncio.sleep(0.01)
@@ -2,6 +2,10 @@
 
 import pytest
 from modules.navigation.spatial import (
+    Direction,
+    Zone,
+    Movement,
+    Urgency,
     analyze_direction,
     analyze_zone,
     analyze_movement,
@@ -14,111 +18,99 @@ def test_analyze_direction_left():
     """Test direction analysis - left."""
     bbox = (0.1, 0.3, 0.1, 0.1)  # Center at 0.15 (< 0.33 = left)
     direction = analyze_direction(bbox)
-    assert direction == "left"
+    assert direction == Direction.LEFT
 
 
 def test_analyze_direction_center():
     """Test direction analysis - center."""
     bbox = (0.4, 0.3, 0.1, 0.1)  # Center at 0.45 (between 0.33 and 0.66)
     direction = analyze_direction(bbox)
-    assert direction == "center"
+    assert direction == Direction.CENTER
 
 
 def test_analyze_direction_right():
     """Test direction analysis - right."""
     bbox = (0.7, 0.3, 0.1, 0.1)  # Center at 0.75 (> 0.66)
     direction = analyze_direction(bbox)
-    assert direction == "right"
+    assert direction == Direction.RIGHT
 
 
 def test_analyze_zone_near():
     """Test zone analysis - near."""
     bbox = (0.3, 0.3, 0.4, 0.4)  # Area = 0.16 (> 0.15 = near)
     zone = analyze_zone(bbox)
-    assert zone == "near"
+    assert zone == Zone.NEAR
 
 
 def test_analyze_zone_mid():
     """Test zone analysis - mid."""
     bbox = (0.3, 0.3, 0.2, 0.3)  # Area = 0.06 (between 0.05 and 0.15)
     zone = analyze_zone(bbox)
-    assert zone == "mid"
+    assert zone == Zone.MID
 
 
 def test_analyze_zone_far():
     """Test zone analysis - far."""
     bbox = (0.4, 0.4, 0.1, 0.1)  # Area = 0.01 (< 0.05)
     zone = analyze_zone(bbox)
-    assert zone == "far"
+    assert zone == Zone.FAR
 
 
 def test_analyze_movement_approaching():
     """Test movement analysis - approaching."""
-    current_bbox = (0.3, 0.3, 0.2, 0.2)  # Area = 0.04
-    history = [
-        {"bbox": (0.3, 0.3, 0.15, 0.15)},  # Area = 0.0225 (smaller)
-        {"bbox": (0.3, 0.3, 0.18, 0.18)},  # Area = 0.0324
-    ]
-    
-    movement = analyze_movement(current_bbox, history)
-    assert movement == "approaching"
+    movement = analyze_movement(0.04, 0.0225)  # grew past the 5% band
+    assert movement == Movement.APPROACHING
 
 
 def test_analyze_movement_receding():
     """Test movement analysis - receding."""
-    current_bbox = (0.3, 0.3, 0.1, 0.1)  # Area = 0.01
-    history = [
-        {"bbox": (0.3, 0.3, 0.2, 0.2)},  # Area = 0.04 (larger)
-        {"bbox": (0.3, 0.3, 0.15, 0.15)},  # Area = 0.0225
-    ]
-    
-    movement = analyze_movement(current_bbox, history)
-    assert movement == "receding"
+    movement = analyze_movement(0.01, 0.04)  # shrank past the 5% band
+    assert movement == Movement.RECEDING
 
 
 def test_analyze_movement_stationary():
     """Test movement analysis - stationary."""
-    current_bbox = (0.3, 0.3, 0.1, 0.1)
-    history = [
-        {"bbox": (0.3, 0.3, 0.1, 0.1)},
-        {"bbox": (0.3, 0.3, 0.1, 0.1)},
-    ]
-    
-    movement = analyze_movement(current_bbox, history)
-    assert movement == "stationary"
+    movement = analyze_movement(0.01, 0.01)
+    assert movement == Movement.STATIONARY
+
+
+def test_analyze_movement_no_history():
+    """Tracks without a previous area are stationary."""
+    movement = analyze_movement(0.04, None)
+    assert movement == Movement.STATIONARY
 
 
 def test_compute_urgency_critical():
     """Test urgency computation - critical."""
-    urgency = compute_urgency("near", "approaching")
-    assert urgency == "critical"
+    urgency = compute_urgency(Zone.NEAR, Movement.APPROACHING)
+    assert urgency == Urgency.CRITICAL
 
 
 def test_compute_urgency_high():
     """Test urgency computation - high."""
-    urgency = compute_urgency("near", "stationary")
-    assert urgency == "high"
+    urgency = compute_urgency(Zone.NEAR, Movement.STATIONARY)
+    assert urgency == Urgency.HIGH
 
 
 def test_compute_urgency_medium():
     """Test urgency computation - medium."""
-    urgency = compute_urgency("mid", "approaching")
-    assert urgency == "medium"
+    urgency = compute_urgency(Zone.MID, Movement.APPROACHING)
+    assert urgency == Urgency.MEDIUM
 
 
 def test_compute_urgency_low():
     """Test urgency computation - low."""
-    urgency = compute_urgency("far", "stationary")
-    assert urgency == "low"
+    urgency = compute_urgency(Zone.FAR, Movement.STATIONARY)
+    assert urgency == Urgency.LOW
 
 
 def test_generate_guidance_text_critical():
     """Test guidance text generation - critical situation."""
     text = generate_guidance_text(
         label="person",
-        direction="left",
-        zone="near",
-        movement="approaching",
+        direction=Direction.LEFT,
+        zone=Zone.NEAR,
+        movement=Movement.APPROACHING,
     )
     assert "person" in text.lower()
     assert "close" in text.lower()
@@ -128,9 +120,9 @@ def test_generate_guidance_text_approaching():
     """Test guidance text generation - approaching."""
     text = generate_guidance_text(
         label="obstacle",
-        direction="center",
-        zone="mid",
-        movement="approaching",
+        direction=Direction.CENTER,
+        zone=Zone.MID,
+        movement=Movement.APPROACHING,
     )
     assert "obstacle" in text.lower()
     assert "approach" in text.lower()
@@ -140,10 +132,54 @@ def test_generate_guidance_text_stationary():
     """Test guidance text generation - stationary."""
     text = generate_guidance_text(
         label="door",
-        direction="right",
-        zone="mid",
-        movement="stationary",
+        direction=Direction.RIGHT,
+        zone=Zone.MID,
+        movement=Movement.STATIONARY,
     )
     assert "door" in text.lower()
     assert "right" in text.lower()
 
+
+
+def test_analyze_batch_matches_scalar():
+    """Batch analyzer must agree with the scalar per-track functions."""
+    import numpy as np
+    from modules.navigation.spatial import analyze_batch
+
+    bboxes = [
+        (0.1, 0.3, 0.1, 0.1),   # left, far
+        (0.3, 0.3, 0.4, 0.4),   # center, near
+        (0.7, 0.3, 0.2, 0.3),   # right, mid
+    ]
+    prev_areas = [0.005, 0.16, 0.08]  # approaching, stationary, receding
+
+    dir_codes, zone_codes, move_codes, urgency_codes, areas = analyze_batch(
+        np.array(bboxes, dtype=np.float32),
+        np.array(prev_areas, dtype=np.float32),
+    )
+
+    for i, bbox in enumerate(bboxes):
+        expected_direction = analyze_direction(bbox)
+        expected_zone = analyze_zone(bbox)
+        expected_movement = analyze_movement(bbox[2] * bbox[3], prev_areas[i])
+        expected_urgency = compute_urgency(expected_zone, expected_movement)
+
+        # Enum members are ints, so batch codes compare directly
+        assert dir_codes[i] == expected_direction
+        assert zone_codes[i] == expected_zone
+        assert move_codes[i] == expected_movement
+        assert urgency_codes[i] == expected_urgency
+        assert areas[i] == pytest.approx(bbox[2] * bbox[3])
+
+
+def test_analyze_batch_no_history_is_stationary():
+    """Tracks without history (NaN prev area) are treated as stationary."""
+    import numpy as np
+    from modules.navigation.spatial import MOVEMENTS, analyze_batch
+
+    bboxes = np.array([(0.3, 0.3, 0.2, 0.2)], dtype=np.float32)
+    prev_areas = np.array([np.nan], dtype=np.float32)
+
+    _, _, move_codes, _, _ = analyze_batch(bboxes, prev_areas)
+
+    assert MOVEMENTS[move_codes[0]] == "stationary"
@@ -1,7 +1,8 @@
 """Tests for tracker module."""
 
+import numpy as np
 import pytest
-from modules.tracker.matching import compute_iou, match_detections_to_tracks
+from modules.tracker.matching import compute_iou, iou_matrix, match_detections_to_tracks
 from modules.tracker.tracker import Tracker
 
 
@@ -36,6 +37,32 @@ def test_compute_iou_identical():
     assert abs(iou - 1.0) < 0.0001  # Allow for floating-point precision
 
 
+@pytest.mark.parametrize("n", [1, 8, 128])
+def test_iou_matrix_matches_scalar(n):
+    """Test that the vectorized IoU matrix agrees with compute_iou.
+
+    The sizes span both fast paths: small n goes through the scalar
+    loop, n=128 through the broadcast pipeline (or the compiled kernel
+    when Numba is installed).
+    """
+    rng = np.random.default_rng(0)
+    det_boxes = rng.random((n, 4)).astype(np.float32)
+    trk_boxes = rng.random((n, 4)).astype(np.float32)
+
+    # iou_matrix takes track boxes in corner form, as the tracker caches them
+    trk_xyxy = trk_boxes.copy()
+    trk_xyxy[:, 2:] += trk_xyxy[:, :2]
+
+    got = np.array(iou_matrix(det_boxes, trk_xyxy))
+
+    ref = np.empty((n, n), dtype=np.float64)
+    for i in range(n):
+        for j in range(n):
+            ref[i, j] = compute_iou(tuple(det_boxes[i]), tuple(trk_boxes[j]))
+
+    np.testing.assert_allclose(got, ref, atol=1e-5)
+
+
 def test_match_detections_to_tracks():
     """Test detection-to-track matching."""
     detections = [
@@ -43,13 +70,17 @@ def test_match_detections_to_tracks():
         (1, (0.5, 0.5, 0.1, 0.1)),
     ]
     
-    tracks = {
-        1: (0.12, 0.12, 0.1, 0.1),  # Should match detection 0
-        2: (0.52, 0.52, 0.1, 0.1),  # Should match detection 1
-    }
+    track_ids = [1, 2]
+    trk_xyxy = np.array(
+        [
+            (0.12, 0.12, 0.22, 0.22),  # Should match detection 0
+            (0.52, 0.52, 0.62, 0.62),  # Should match detection 1
+        ],
+        dtype=np.float32,
+    )
     
     matches, unmatched_dets, unmatched_tracks = match_detections_to_tracks(
-        detections, tracks, iou_threshold=0.3
+        detections, track_ids, trk_xyxy, iou_threshold=0.3
     )
     
     assert len(matches) == 2
@@ -1,14 +1,18 @@
 """FastAPI server with WebSocket for UI."""
 
 import asyncio
-import base64
+import hashlib
 import json
 import logging
+import os
+import struct
+from collections import OrderedDict
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contracts.schemas import (
     FramePacket,
     DetectionResult,
@@ -24,6 +28,87 @@ from core_platform.control_state import ControlState
 
 logger = logging.getLogger(__name__)
 
+# Faster JSON for the websocket stream when available (~3-5x stdlib on
+# these payloads); the wire format is identical either way
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+# Event types forwarded to the UI; everything else on the bus (frame
+# batches, scene descriptions) is not part of the wire protocol
+_STREAMED_EVENTS = (
+    DetectionResult,
+    TrackUpdate,
+    NavigationGuidance,
+    FusionAnnouncement,
+    SystemMetric,
+)
+
+# Upper bound on events coalesced into one websocket frame
+_BATCH_MAX = 64
+
+# Video frames go out as binary WebSocket messages: this fixed header
+# (little-endian frame_id:u64, timestamp_ms:u64, width:u16, height:u16)
+# followed by the raw JPEG. No base64 (33% wire overhead) and no JSON
+# wrapping on the highest-bandwidth path; events stay on the text channel.
+_FRAME_HEADER = struct.Struct("<QQHH")
+
+# Frames of detection/track state kept for overlay rendering (20 s at
+# 30 fps); without a cap these caches grow for the life of the process
+_OVERLAY_CACHE_FRAMES = 600
+
+
+def _remember(cache: OrderedDict, frame_id: int, value: Any) -> None:
+    """Insert into a frame-keyed overlay cache, evicting the oldest."""
+    cache[frame_id] = value
+    while len(cache) > _OVERLAY_CACHE_FRAMES:
+        cache.popitem(last=False)
+
+
+def _ctl_play(control_state: ControlState, value: "dict | None") -> None:
+    control_state.update(paused=False)
+
+
+def _ctl_pause(control_state: ControlState, value: "dict | None") -> None:
+    control_state.update(paused=True)
+
+
+def _ctl_speed(control_state: ControlState, value: "dict | None") -> None:
+    if value:
+        control_state.update(speed=float(value.get("speed", 1.0)))
+
+
+def _ctl_seek(control_state: ControlState, value: "dict | None") -> None:
+    if value:
+        control_state.update(pending_seek=int(value.get("frame_id", 0)))
+
+
+def _ctl_set_threshold(control_state: ControlState, value: "dict | None") -> None:
+    if value:
+        control_state.update(**value)
+
+
+# Control kind -> handler; O(1) dispatch, and new kinds are one entry
+# here instead of another elif arm
+_CONTROL_ACTIONS = {
+    "play": _ctl_play,
+    "pause": _ctl_pause,
+    "speed": _ctl_speed,
+    "seek": _ctl_seek,
+    "set_threshold": _ctl_set_threshold,
+}
+
+
+# /sources scan result, keyed on the samples directory's mtime: one stat
+# per request instead of a glob + stat walk over every entry. Adding or
+# removing a sample bumps the directory mtime and invalidates the cache.
+_sources_cache: dict = {"mtime": -1, "value": None}
+
 
 def create_app(
     frame_bus: FrameBus,
@@ -43,14 +128,26 @@ def create_app(
     app.state.result_bus = result_bus
     app.state.control_state = control_state
     
-    # Track latest detections and tracks for overlay rendering
-    app.state.latest_detections: dict[int, DetectionResult] = {}
-    app.state.latest_tracks: dict[int, list[TrackUpdate]] = {}
+    # Latest detections and tracks for overlay rendering, bounded to the
+    # most recent _OVERLAY_CACHE_FRAMES frames
+    app.state.latest_detections: OrderedDict[int, DetectionResult] = OrderedDict()
+    app.state.latest_tracks: OrderedDict[int, list[TrackUpdate]] = OrderedDict()
     
+    # index.html is the hottest HTTP path; read it once and serve from
+    # memory with an ETag instead of a stat + open per request
+    index_bytes = (static_dir / "index.html").read_bytes()
+    index_etag = f'"{hashlib.md5(index_bytes).hexdigest()}"'
+
     @app.get("/")
-    async def index():
+    async def index(request: Request):
         """Serve main UI page."""
-        return FileResponse(static_dir / "index.html")
+        if request.headers.get("if-none-match") == index_etag:
+            return Response(status_code=304, headers={"ETag": index_etag})
+        return Response(
+            index_bytes,
+            media_type="text/html",
+            headers={"ETag": index_etag, "Cache-Control": "public, max-age=60"},
+        )
     
     @app.get("/health")
     async def health():
@@ -61,24 +158,19 @@ def create_app(
         })
     
     @app.post("/control")
-    async def control(event: ControlEvent):
+    async def control(request: Request):
         """Handle control events from UI."""
         try:
-            if event.kind == "play":
-                control_state.update(paused=False)
-            elif event.kind == "pause":
-                control_state.update(paused=True)
-            elif event.kind == "speed" and event.value:
-                speed = float(event.value.get("speed", 1.0))
-                control_state.update(speed=speed)
-            elif event.kind == "seek" and event.value:
-                frame_id = int(event.value.get("frame_id", 0))
-                control_state.update(pending_seek=frame_id)
-            elif event.kind == "set_threshold" and event.value:
-                control_state.update(**event.value)
-            
+            # pydantic-core parses the raw body straight into the model,
+            # skipping FastAPI's json.loads + dict re-validation pass
+            event = ControlEvent.model_validate_json(await request.body())
+
+            action = _CONTROL_ACTIONS.get(event.kind)
+            if action is not None:
+                action(control_state, event.value)
+
             return JSONResponse({"status": "ok"})
-        
+
         except Exception as e:
             logger.error(f"Control error: {e}", exc_info=True)
             return JSONResponse({"status": "error", "message": str(e)}, status_code=400)
@@ -86,139 +178,129 @@ def create_app(
     @app.get("/sources")
     async def list_sources():
         """List available video sources."""
-        sources = []
         data_dir = Path("data/samples")
-        
-        if data_dir.exists():
-            # Find MP4 files
-            for mp4 in data_dir.glob("*.mp4"):
-                sources.append({
-                    "type": "mp4",
-                    "path": str(mp4),
-                    "name": mp4.name,
-                })
-            
-            # Find frame directories
-            for subdir in data_dir.iterdir():
-                if subdir.is_dir() and (subdir / "metadata.json").exists():
-                    sources.append({
+
+        if not data_dir.exists():
+            return JSONResponse({"sources": []})
+
+        mtime = data_dir.stat().st_mtime_ns
+        if mtime == _sources_cache["mtime"]:
+            return JSONResponse(_sources_cache["value"])
+
+        mp4s = []
+        frame_dirs = []
+        # One scandir pass; DirEntry answers is_dir() from the readdir
+        # d_type without a stat per entry
+        with os.scandir(data_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".mp4"):
+                    mp4s.append({
+                        "type": "mp4",
+                        "path": entry.path,
+                        "name": entry.name,
+                    })
+                elif entry.is_dir() and (Path(entry.path) / "metadata.json").exists():
+                    frame_dirs.append({
                         "type": "frames",
-                        "path": str(subdir),
-                        "name": subdir.name,
+                        "path": entry.path,
+                        "name": entry.name,
                     })
-        
-        return JSONResponse({"sources": sources})
+
+        _sources_cache["value"] = {"sources": mp4s + frame_dirs}
+        _sources_cache["mtime"] = mtime
+        return JSONResponse(_sources_cache["value"])
     
     @app.websocket("/ws")
     async def websocket_endpoint(websocket: WebSocket):
         """WebSocket endpoint for streaming data to UI."""
         await websocket.accept()
         logger.info("WebSocket client connected")
-        
+
         try:
-            # Create tasks for streaming
-            frame_task = asyncio.create_task(stream_frames(websocket, frame_bus))
-            event_task = asyncio.create_task(stream_events(websocket, result_bus, app.state))
-            
-            # Wait for either task to complete (or client disconnect)
-            done, pending = await asyncio.wait(
-                [frame_task, event_task],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-            
-            # Cancel remaining tasks
-            for task in pending:
-                task.cancel()
-        
-        except WebSocketDisconnect:
+            # One task per stream; either failing (including the
+            # disconnect a send raises) cancels its sibling atomically,
+            # without asyncio.wait's done/pending bookkeeping
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(stream_frames(websocket, frame_bus))
+                tg.create_task(stream_events(websocket, result_bus, app.state))
+
+        except* WebSocketDisconnect:
             logger.info("WebSocket client disconnected")
-        except Exception as e:
-            logger.error(f"WebSocket error: {e}", exc_info=True)
+        except* Exception as eg:
+            for exc in eg.exceptions:
+                logger.error(f"WebSocket error: {exc}", exc_info=exc)
     
     return app
 
 
 async def stream_frames(websocket: WebSocket, frame_bus: FrameBus) -> None:
-    """Stream frames to WebSocket client at reduced rate."""
-    frame_counter = 0
-    frame_rate_divisor = 6  # Send every 6th frame (5 FPS if source is 30 FPS)
-    
-    try:
-        async for frame in frame_bus.subscribe():
-            frame_counter += 1
-            
-            # Send every Nth frame to limit bandwidth
-            if frame_counter % frame_rate_divisor != 0:
-                continue
-            
-            # Encode frame as base64
-            jpg_base64 = base64.b64encode(frame.jpg_bytes).decode('utf-8')
-            
-            # Send to client
-            await websocket.send_json({
-                "type": "frame",
-                "frame_id": frame.frame_id,
-                "timestamp_ms": frame.timestamp_ms,
-                "width": frame.width,
-                "height": frame.height,
-                "jpg_base64": jpg_base64,
-            })
-    
-    except Exception as e:
-        logger.error(f"Frame stream error: {e}", exc_info=True)
+    """Stream frames to WebSocket client at reduced rate.
+
+    Errors (including client disconnect) propagate to the endpoint's
+    TaskGroup, which cancels the sibling event stream.
+    """
+    # Every 6th frame (5 FPS if source is 30 FPS) to limit bandwidth;
+    # the bus filters on the publisher side, so the 5/6 this stream
+    # would discard are never delivered to this task at all
+    async for frame in frame_bus.subscribe(stride=6):
+        # Send to client: fixed binary header + JPEG bytes (join
+        # accepts the memoryview jpg_bytes may hand back)
+        header = _FRAME_HEADER.pack(
+            frame.frame_id, frame.timestamp_ms, frame.width, frame.height
+        )
+        await websocket.send_bytes(b"".join((header, frame.jpg_bytes)))
 
 
 async def stream_events(websocket: WebSocket, result_bus: ResultBus, app_state: Any) -> None:
-    """Stream events to WebSocket client."""
-    try:
+    """Stream events to WebSocket client, coalescing bursts.
+
+    A reader task feeds a bounded queue; the writer drains whatever has
+    accumulated and ships it as one batch frame, so the per-track burst
+    each tracked frame produces costs one websocket send instead of one
+    per event. The queue drops on overflow - the UI stream is
+    best-effort and must not backpressure the pipeline. Send errors
+    propagate to the endpoint's TaskGroup, as in stream_frames.
+    """
+    out_q: asyncio.Queue = asyncio.Queue(maxsize=1024)
+
+    async def reader() -> None:
         async for event in result_bus.subscribe_all():
             # Store latest detections and tracks for overlay
             if isinstance(event, DetectionResult):
-                app_state.latest_detections[event.frame_id] = event
-                
-                # Send to client
-                await websocket.send_json({
-                    "type": "event",
-                    "event_type": "DetectionResult",
-                    "data": event.model_dump(),
-                })
-            
+                _remember(app_state.latest_detections, event.frame_id, event)
             elif isinstance(event, TrackUpdate):
-                if event.frame_id not in app_state.latest_tracks:
-                    app_state.latest_tracks[event.frame_id] = []
-                app_state.latest_tracks[event.frame_id].append(event)
-                
-                # Send to client
-                await websocket.send_json({
-                    "type": "event",
-                    "event_type": "TrackUpdate",
-                    "data": event.model_dump(),
-                })
-            
-            elif isinstance(event, NavigationGuidance):
-                # Send to client
-                await websocket.send_json({
-                    "type": "event",
-                    "event_type": "NavigationGuidance",
-                    "data": event.model_dump(),
-                })
-            
-            elif isinstance(event, FusionAnnouncement):
-                # Send to client
-                await websocket.send_json({
-                    "type": "event",
-                    "event_type": "FusionAnnouncement",
-                    "data": event.model_dump(),
-                })
-            
-            elif isinstance(event, SystemMetric):
-                # Send to client
-                await websocket.send_json({
+                tracks = app_state.latest_tracks
+                if event.frame_id not in tracks:
+                    _remember(tracks, event.frame_id, [])
+                tracks[event.frame_id].append(event)
+            elif not isinstance(event, _STREAMED_EVENTS):
+                continue
+
+            try:
+                out_q.put_nowait({
                     "type": "event",
-                    "event_type": "SystemMetric",
-                    "data": event.model_dump(),
+                    "event_type": type(event).__name__,
+                    "data": asdict(event),
                 })
-    
-    except Exception as e:
-        logger.error(f"Event stream error: {e}", exc_info=True)
+            except asyncio.QueueFull:
+                pass
+
+    reader_task = asyncio.create_task(reader())
+    try:
+        while True:
+            batch = [await out_q.get()]
+            while len(batch) < _BATCH_MAX:
+                try:
+                    batch.append(out_q.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            if len(batch) == 1:
+                await websocket.send_text(_json_dumps(batch[0]))
+            else:
+                await websocket.send_text(
+                    _json_dumps({"type": "batch", "items": batch})
+                )
+    finally:
+        reader_task.cancel()
 
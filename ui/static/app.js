@@ -40,7 +40,8 @@ function connectWebSocket() {
     const wsUrl = `${protocol}//${window.location.host}/ws`;
     
     ws = new WebSocket(wsUrl);
-    
+    ws.binaryType = 'arraybuffer';  // video frames arrive as binary
+
     ws.onopen = () => {
         console.log('WebSocket connected');
         statusIndicator.classList.add('connected');
@@ -48,12 +49,18 @@ function connectWebSocket() {
     };
     
     ws.onmessage = (event) => {
+        if (event.data instanceof ArrayBuffer) {
+            handleBinaryFrame(event.data);
+            return;
+        }
+
         const msg = JSON.parse(event.data);
-        
-        if (msg.type === 'frame') {
-            handleFrame(msg);
-        } else if (msg.type === 'event') {
+
+        if (msg.type === 'event') {
             handleEvent(msg);
+        } else if (msg.type === 'batch') {
+            // Coalesced events - one WebSocket frame carrying many
+            msg.items.forEach(handleEvent);
         }
     };
     
@@ -137,23 +144,39 @@ function sendControl(kind, value) {
     .catch(error => console.error('Control request failed:', error));
 }
 
-function handleFrame(msg) {
+function handleBinaryFrame(buffer) {
+    // Fixed header (little-endian): frame_id:u64, timestamp_ms:u64,
+    // width:u16, height:u16 - then raw JPEG bytes. Mirrors
+    // _FRAME_HEADER in ui/server.py.
+    const view = new DataView(buffer);
+    const msg = {
+        frame_id: Number(view.getBigUint64(0, true)),
+        timestamp_ms: Number(view.getBigUint64(8, true)),
+        width: view.getUint16(16, true),
+        height: view.getUint16(18, true),
+    };
+    const jpg = new Blob([buffer.slice(20)], { type: 'image/jpeg' });
+    handleFrame(msg, URL.createObjectURL(jpg));
+}
+
+function handleFrame(msg, jpgUrl) {
     currentFrame = msg;
-    
+
     // Update frame info
     frameInfo.textContent = `Frame: ${msg.frame_id}`;
-    
+
     // Draw frame
     const img = new Image();
     img.onload = () => {
         canvas.width = msg.width;
         canvas.height = msg.height;
         ctx.drawImage(img, 0, 0);
-        
+
         // Draw overlays
         drawOverlays(msg.frame_id);
+        URL.revokeObjectURL(jpgUrl);
     };
-    img.src = 'data:image/jpeg;base64,' + msg.jpg_base64;
+    img.src = jpgUrl;
 }
 
 function drawOverlays(frameId) {